@@ -11,12 +11,6 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from ovos_bus_client.client.client import MessageBusClient, GUIWebsocketClient
-from ovos_bus_client.message import Message, GUIMessage
-from ovos_bus_client.send_func import send
-from ovos_bus_client.session import Session, SessionManager, UtteranceState
-from ovos_bus_client.conf import client_from_config
-
 """
 Mycroft Messagebus Client.
 
@@ -26,12 +20,57 @@ The messagebus client allows the developer to register handlers for
 specific message types and emitting messages to other services and
 clients connected to the bus.
 """
+import importlib
+
+__all__ = (
+    "MessageBusClient",
+    "GUIWebsocketClient",
+    "GUIMessage",
+    "Message",
+    "send",
+    "Session",
+    "SessionManager",
+    "UtteranceState",
+    "client_from_config"
+)
+
+# public names are resolved on first access (PEP 562) so that importing the
+# package does not pull in the websocket client and its dependencies
+_LAZY = {
+    "MessageBusClient": ("ovos_bus_client.client.client", "MessageBusClient"),
+    "GUIWebsocketClient": ("ovos_bus_client.client.client", "GUIWebsocketClient"),
+    "Message": ("ovos_bus_client.message", "Message"),
+    "GUIMessage": ("ovos_bus_client.message", "GUIMessage"),
+    "send": ("ovos_bus_client.send_func", "send"),
+    "Session": ("ovos_bus_client.session", "Session"),
+    "SessionManager": ("ovos_bus_client.session", "SessionManager"),
+    "UtteranceState": ("ovos_bus_client.session", "UtteranceState"),
+    "client_from_config": ("ovos_bus_client.conf", "client_from_config")
+}
+
+# submodules that used to be imported with the package, reachable as
+# attributes for backwards compatibility
+_SUBMODULES = frozenset({"apis", "client", "conf", "hpm", "message",
+                         "scripts", "send_func", "session", "util", "version"})
+
+
+def __getattr__(name):
+    try:
+        module, attr = _LAZY[name]
+    except KeyError:
+        if name in _SUBMODULES:
+            try:
+                return importlib.import_module(f"{__name__}.{name}")
+            except ImportError as e:
+                # hasattr/getattr(default) expect AttributeError, e.g. when
+                # an optional dependency of the submodule is missing
+                raise AttributeError(f"module {__name__!r} has no attribute "
+                                     f"{name!r}: {e}") from e
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    obj = getattr(importlib.import_module(module), attr)
+    globals()[name] = obj
+    return obj
+
 
-__all__ = [
-    MessageBusClient,
-    GUIWebsocketClient,
-    GUIMessage,
-    Message,
-    send,
-    client_from_config
-]
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,7 +1,16 @@
+import hashlib
+import json
 import os
 import shutil
-from os.path import splitext, isfile
-from typing import List, Union, Optional, Callable
+import sys
+import time
+from queue import Queue, Full
+from threading import Lock, RLock, Thread, current_thread
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from os.path import splitext
+from typing import Dict, List, Union, Optional, Callable, Tuple
 
 from ovos_config import Configuration
 from ovos_config.locations import get_xdg_cache_save_path
@@ -48,21 +57,153 @@ class GUIWidgets:
         self.bus.emit(Message("ovos.widgets.update", {"type": widget_type, "data": widget_data}))
 
 
+def _tree_signature(path: str) -> str:
+    """
+    Cheap fingerprint of a directory tree: a hash over the sorted
+    (relative path, size, modification time) of every file, so renames,
+    additions and removals change it too. A single stat per file,
+    nothing is read
+    """
+    files = []
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    st = entry.stat()
+                    files.append((os.path.relpath(entry.path, path),
+                                  st.st_size, st.st_mtime_ns))
+    files.sort()
+    return hashlib.sha1(repr(files).encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=512)
+def _normalize_page_name(page_name: str) -> str:
+    """
+    Normalize a requested GUI resource, results are cached since skills
+    keep showing the same few pages (the deprecation error is logged once)
+    @param page_name: string name of a GUI resource
+    @return: normalized string name (`.qml` removed for other GUI support)
+    """
+    # string check only, resource names never are absolute paths
+    if os.path.isabs(page_name):
+        raise ValueError("GUI resources should specify a resource name and not a file path.")
+    file, ext = splitext(page_name)
+    if ext == ".qml":
+        LOG.error("GUI resources should exclude gui-specific file "
+                  f"extensions. This call should probably pass "
+                  f"`{file}`, instead of `{page_name}`")
+        return file
+    return page_name
+
+
+_MISSING = object()  # sentinel for session keys that were never set
+
+
+def _approx_size(value) -> int:
+    """
+    Rough size in bytes of a session value, containers are estimated from
+    their first item so the cost does not grow with the value
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple)) and value:
+        size += len(value) * sys.getsizeof(value[0])
+    elif isinstance(value, dict) and value:
+        size += len(value) * sys.getsizeof(next(iter(value.values())))
+    return size
+
+
+@lru_cache(maxsize=128)
+def _gui_cache_dirs(cache_root: str, skill_id: str, frameworks: tuple) -> tuple:
+    """
+    Directories in the ovos-gui cache that may hold a resource of this skill,
+    in lookup order: shared resources first, then one per framework
+    """
+    skill_cache = os.path.join(cache_root, skill_id)
+    return (skill_cache,) + tuple(os.path.join(skill_cache, framework)
+                                  for framework in frameworks)
+
+
+class _EmitWorker:
+    """
+    Single daemon thread emitting queued messages in order, used by
+    GUIInterface objects created with `async_emit=True`
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._queue = Queue(maxsize=maxsize)
+        self._thread = None
+        self._lock = Lock()
+
+    def submit(self, bus, message: Message):
+        """
+        Queue a message to be emitted. Messages are emitted right away,
+        in the calling thread, if the queue is full or if called from the
+        worker itself (e.g. a bus handler), waiting on the queue would
+        deadlock the worker
+        """
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = Thread(target=self._run, daemon=True,
+                                          name="GUIEmitWorker")
+                    self._thread.start()
+        if current_thread() is self._thread:
+            bus.emit(message)
+            return
+        try:
+            self._queue.put_nowait((bus, message))
+        except Full:
+            bus.emit(message)
+
+    def _run(self):
+        while True:
+            bus, message = self._queue.get()
+            try:
+                bus.emit(message)
+            except Exception as e:
+                LOG.error(f"Failed to emit {message.msg_type}: {e}")
+
+
+_EMIT_WORKER = _EmitWorker()
+
+
 class _GUIDict(dict):
     """
     This is a helper dictionary subclass. It ensures that values changed
     in it are propagated to the GUI service in real time.
+
+    `parent_key` is the top level session key holding this dict, writes to
+    it (or to dicts nested in it) mark only that key as changed
     """
 
-    def __init__(self, gui, **kwargs):
+    __slots__ = ("gui", "parent_key")
+
+    def __init__(self, gui, data=None, parent_key=None, **kwargs):
         self.gui = gui
-        super().__init__(**kwargs)
+        self.parent_key = parent_key
+        super().__init__(data or {}, **kwargs)
+        for key, value in self.items():
+            if isinstance(value, dict):
+                super().__setitem__(key, self._wrap(value))
+
+    def _wrap(self, value: dict) -> "_GUIDict":
+        if isinstance(value, _GUIDict) and value.parent_key == self.parent_key:
+            return value
+        return _GUIDict(self.gui, value, parent_key=self.parent_key)
 
     def __setitem__(self, key, value):
         old = self.get(key)
         if old != value:
+            if isinstance(value, dict):
+                value = self._wrap(value)
             super(_GUIDict, self).__setitem__(key, value)
-            self.gui._sync_data()
+            # same guard as GUIInterface.__setitem__, nothing to sync
+            # until a page is shown
+            if self.gui.bus and self.gui._current_page:
+                self.gui._sync_nested(self)
 
 
 class GUIInterface:
@@ -79,9 +220,24 @@ class GUIInterface:
         text: sessionData.time
     """
 
+    # "__dict__" is kept so subclasses can still add their own attributes
+    __slots__ = ("config", "_bus", "_GUIInterface__session_data", "_pages",
+                 "_current_page", "_current_page_idx", "_skill_id",
+                 "_skill_id_prefix", "on_gui_changed_callback", "_events",
+                 "_batching", "_sync_pending", "_dirty_keys", "_lock",
+                 "_session_bytes", "_size_warned",
+                 "_connected", "_connected_ts", "_bus_required_warned",
+                 "_async_emit", "_gui_disabled", "_gui_cached",
+                 "ui_directories",
+                 "__dict__", "__weakref__")
+
+    _CONNECTED_TTL = 0.5  # seconds a `connected` check stays valid
+
     def __init__(self, skill_id: str, bus=None,
                  config: dict = None,
-                 ui_directories: dict = None):
+                 ui_directories: dict = None,
+                 async_emit: bool = False,
+                 cache_now: bool = False):
         """
         Create an interface to the GUI module. Values set here are exposed to
         the GUI client as sessionData
@@ -89,6 +245,10 @@ class GUIInterface:
         @param bus: MessagebusClient object to connect to
         @param config: dict gui Configuration
         @param ui_directories: dict framework to directory containing resources
+        @param async_emit: if True, messages are emitted in order from a
+            background thread instead of blocking the caller
+        @param cache_now: if True, copy GUI resources to the ovos-gui cache
+            right away instead of when a bus is first set
         """
         config = config or Configuration().get("gui", {})
         self.config = config
@@ -97,14 +257,36 @@ class GUIInterface:
         self._pages = []
         self.current_page_idx = -1
         self._skill_id = skill_id
+        self._skill_id_prefix = f"{skill_id}."
         self.on_gui_changed_callback = None
-        self._events = []
+        self._events: Dict[str, List[Callable]] = {}
+        self._batching = 0  # nesting depth of batch_update()
+        self._sync_pending = False
+        self._dirty_keys = set()  # session keys not yet sent to the GUI
+        self._session_bytes = 0  # running estimate, see session_data_bytes
+        self._size_warned = set()
+        # guards session data and pages, messages are emitted after release
+        self._lock = RLock()
+        self._connected = False
+        self._connected_ts = 0.0  # time.monotonic() of the last check
+        self._bus_required_warned = False
+        self._async_emit = async_emit
+        # read on every GUI update, refreshed on "configuration.updated"
+        self._gui_disabled = Configuration().get("gui", {}).get("disable_gui", False)
         self.ui_directories = ui_directories or dict()
+        self._gui_cached = False
         if bus:
             self.set_bus(bus)
-        self._cache_gui_files()
+        if cache_now:
+            self._cache_gui_files()
 
     def _cache_gui_files(self):
+        if self._gui_cached:
+            return
+        if self.gui_disabled:
+            LOG.debug(f"GUI disabled, not caching {self.skill_id} GUI resources")
+            return
+        self._gui_cached = True
         if not self.ui_directories:
             LOG.debug(f"{self.skill_id} has no GUI resources")
             return
@@ -113,29 +295,64 @@ class GUIInterface:
         GUI_CACHE_PATH = get_xdg_cache_save_path('ovos_gui')
 
         output_path = f"{GUI_CACHE_PATH}/{self.skill_id}"
+
+        # skip the copy entirely if no source file changed since last time
+        sig_path = f"{output_path}/.ovos_cache_sig.json"
+        signature = {framework: [bpath, _tree_signature(bpath)]
+                     for framework, bpath in self.ui_directories.items()
+                     if os.path.isdir(bpath)}
+        try:
+            with open(sig_path) as f:
+                if json.load(f) == signature:
+                    LOG.debug(f"{self.skill_id} cached GUI resources are up to date")
+                    return
+        except (OSError, ValueError):
+            pass
+
+        # something changed, rebuild the cache from scratch so files that
+        # were removed or renamed in the skill do not linger in it
         if os.path.exists(output_path):
-            LOG.info(f"Removing existing {self.skill_id} cached GUI resources before updating")
             shutil.rmtree(output_path)
-
+        frameworks = []
         for framework, bpath in self.ui_directories.items():
             if framework == "all":
-                # mostly applies to image files
+                # mostly applies to image files, copied first since it
+                # shares the top level folder with the framework folders
                 shutil.copytree(bpath, output_path, dirs_exist_ok=True)
                 LOG.debug(f"Copied {self.skill_id} shared GUI resources from {bpath} to {output_path}")
                 continue
             if not os.path.isdir(bpath):
                 LOG.error(f"invalid '{framework}' resources directory: {bpath}")
                 continue
-            shutil.copytree(bpath, f"{output_path}/{framework}", dirs_exist_ok=True)
-            LOG.debug(f"Copied {self.skill_id} GUI resources from {bpath} to {output_path}/{framework}")
+            frameworks.append((bpath, f"{output_path}/{framework}"))
+
+        # framework folders are independent, copy them concurrently
+        with ThreadPoolExecutor(max_workers=min(4, len(frameworks) or 1)) as pool:
+            copies = [(pool.submit(shutil.copytree, bpath, dst,
+                                   dirs_exist_ok=True), bpath, dst)
+                      for bpath, dst in frameworks]
+        for copy, bpath, dst in copies:
+            copy.result()  # re-raise copy errors
+            LOG.debug(f"Copied {self.skill_id} GUI resources from {bpath} to {dst}")
+
+        os.makedirs(output_path, exist_ok=True)
+        with open(sig_path, "w") as f:
+            json.dump(signature, f)
 
     def set_bus(self, bus=None):
         self._bus = bus or get_mycroft_bus()
         self.setup_default_handlers()
+        # the cache is only useful once this interface can show pages
+        self._cache_gui_files()
 
     @property
     def gui_disabled(self) -> bool:
-        return Configuration().get("gui", {}).get("disable_gui", False)
+        return self._gui_disabled
+
+    def _on_config_updated(self, message: Message = None):
+        self._gui_disabled = Configuration().get("gui", {}).get("disable_gui", False)
+        if self._bus is not None:
+            self._cache_gui_files()
 
     @property
     def bus(self):
@@ -158,15 +375,44 @@ class GUIInterface:
     @skill_id.setter
     def skill_id(self, val: str):
         self._skill_id = val
+        self._skill_id_prefix = f"{val}."
 
     @property
     def page(self) -> Optional[str]:
         """
         Return the active GUI page name to show
         """
-        if not len(self._pages) or self.current_page_idx >= len(self._pages):
-            return None
-        return self._pages[self.current_page_idx]
+        return self._current_page
+
+    @property
+    def current_page_idx(self) -> int:
+        """
+        Index of the active page in `pages`
+        """
+        return self._current_page_idx
+
+    @current_page_idx.setter
+    def current_page_idx(self, val: int):
+        # `page` is read on every session data change, resolve it only here
+        self._current_page_idx = val
+        if not len(self._pages) or val >= len(self._pages):
+            self._current_page = None
+        else:
+            self._current_page = self._pages[val]
+
+    def _require_bus(self) -> bool:
+        """
+        Check that a bus is bound before sending anything to the GUI,
+        a missing bus is logged once instead of raising on every call
+        @return: True if messages can be emitted
+        """
+        if self._bus is not None:
+            return True
+        if not self._bus_required_warned:
+            self._bus_required_warned = True
+            LOG.warning(f"{self.skill_id} GUI bus not set, did you call "
+                        f"self.bind() ? GUI updates will be dropped")
+        return False
 
     @property
     def connected(self) -> bool:
@@ -176,7 +422,19 @@ class GUIInterface:
         """
         if not self.bus:
             return False
-        return can_use_gui(self.bus)
+        # can_use_gui may query the bus, reuse the answer for a short while
+        now = time.monotonic()
+        if now - self._connected_ts >= self._CONNECTED_TTL:
+            self._connected = can_use_gui(self.bus)
+            self._connected_ts = now
+        return self._connected
+
+    @property
+    def session_data_bytes(self) -> int:
+        """
+        Approximate size in bytes of the session data held for this skill
+        """
+        return self._session_bytes
 
     @property
     def pages(self) -> List[str]:
@@ -189,18 +447,19 @@ class GUIInterface:
         """
         Ensure the specified event prepends this interface's `skill_id`
         """
-        if not event.startswith(f'{self.skill_id}.'):
-            event = f'{self.skill_id}.' + event
-        return event
+        if event.startswith(self._skill_id_prefix):
+            return event
+        return self._skill_id_prefix + event
 
     # events
     def setup_default_handlers(self):
         """
         Sets the handlers for the default messages.
         """
-        msg_type = self.build_message_type('set')
-        self.bus.on(msg_type, self.gui_set)
-        self._events.append((msg_type, self.gui_set))
+        self.register_handlers([('set', self.gui_set)])
+        self.bus.on("configuration.updated", self._on_config_updated)
+        self._events.setdefault("configuration.updated", []).append(
+            self._on_config_updated)
 
     def register_handler(self, event: str, handler: Callable):
         """
@@ -215,11 +474,40 @@ class GUIInterface:
             event (str):    event to catch
             handler:        function to handle the event
         """
+        self.register_handlers([(event, handler)])
+
+    def register_handlers(self, handlers: List[Tuple[str, Callable]]):
+        """
+        Register several handlers for GUI events at once,
+        see `register_handler`
+
+        Args:
+            handlers: list of (event, handler) tuples
+        """
         if not self.bus:
             raise RuntimeError("bus not set, did you call self.bind() ?")
+        for event, handler in handlers:
+            event = self.build_message_type(event)
+            self._events.setdefault(event, []).append(handler)
+            self.bus.on(event, handler)
+
+    def unregister_handler(self, event: str, handler: Callable):
+        """
+        Remove a handler registered with `register_handler`
+
+        Args:
+            event (str):    event the handler was registered for
+            handler:        function to remove
+        """
         event = self.build_message_type(event)
-        self._events.append((event, handler))
-        self.bus.on(event, handler)
+        handlers = self._events.get(event)
+        if not handlers or handler not in handlers:
+            return
+        handlers.remove(handler)
+        if not handlers:
+            del self._events[event]
+        if self.bus:
+            self.bus.remove(event, handler)
 
     def set_on_gui_changed(self, callback: Callable):
         """
@@ -239,34 +527,117 @@ class GUIInterface:
         Arguments:
             message: Messagebus message
         """
-        for key in message.data:
-            self[key] = message.data[key]
+        with self.batch_update(), self._lock:
+            for key, value in message.data.items():
+                self[key] = value
         if self.on_gui_changed_callback:
             self.on_gui_changed_callback()
 
+    @contextmanager
+    def batch_update(self):
+        """
+        Context manager that groups several session data changes into a
+        single "gui.value.set" message, sent when the block exits
+
+            with self.gui.batch_update():
+                self.gui["title"] = title
+                self.gui["text"] = text
+        """
+        with self._lock:
+            self._batching += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batching -= 1
+                flush = not self._batching and self._sync_pending
+            if flush:
+                self._sync_data()
+
     def _sync_data(self):
-        if self.gui_disabled:
-            return
-        if not self.bus:
-            raise RuntimeError("bus not set, did you call self.bind() ?")
-        data = self.__session_data.copy()
-        data.update({'__from': self.skill_id})
-        self.bus.emit(Message("gui.value.set", data))
+        with self._lock:
+            if self._batching:
+                self._sync_pending = True
+                return
+            self._sync_pending = False
+            if self.gui_disabled:
+                return
+            if not self._require_bus():
+                return
+            # gui.value.set is merged into the namespace by ovos-gui,
+            # only the keys that changed since the last sync need to be sent
+            data = {k: self.__session_data[k] for k in self._dirty_keys
+                    if k in self.__session_data}
+            self._dirty_keys.clear()
+        if data:
+            self._emit_delta(data)
+
+    def _emit(self, message: Message):
+        """
+        Send a message to the GUI, from the shared emit thread if this
+        interface was created with `async_emit=True`
+        """
+        if self._async_emit:
+            _EMIT_WORKER.submit(self.bus, message)
+        else:
+            self.bus.emit(message)
 
-    def __setitem__(self, key, value):
-        """Implements set part of dict-like behaviour with named keys."""
-        old = self.__session_data.get(key)
-        if old == value:  # no need to sync
-            return
+    def _emit_delta(self, data: dict):
+        """
+        Send a partial session update, the GUI merges it into the data it
+        already holds for this skill
+        @param data: changed session keys and their values
+        """
+        self._emit(Message("gui.value.set",
+                          {**data, '__from': self.skill_id}))
 
-        # cast to helper dict subclass that syncs data
-        if isinstance(value, dict) and not isinstance(value, _GUIDict):
-            value = _GUIDict(self, **value)
+    def _sync_nested(self, value: dict):
+        """
+        Sync the session key holding a nested dict that was modified
+        """
+        with self._lock:
+            if value.parent_key is not None:
+                self._dirty_keys.add(value.parent_key)
+            else:
+                self._dirty_keys.update(k for k, v in self.__session_data.items()
+                                        if v is value)
+        self._sync_data()
 
-        self.__session_data[key] = value
+    def __setitem__(self, key, value):
+        """
+        Implements set part of dict-like behaviour with named keys.
+
+        Setting a key to the value it already holds is a no-op, so lists
+        mutated in place are not synced by re-assigning the same object;
+        assign a new list instead. Dicts are wrapped in a `_GUIDict` that
+        syncs writes to its keys.
+        """
+        with self._lock:
+            old = self.__session_data.get(key, _MISSING)
+            if old is value or old == value:  # no need to sync
+                return
+
+            # cast to helper dict subclass that syncs data
+            if isinstance(value, dict) and not (isinstance(value, _GUIDict) and
+                                                value.parent_key == key):
+                value = _GUIDict(self, value, parent_key=key)
+
+            self.__session_data[key] = value
+            self._dirty_keys.add(key)
+
+            size = _approx_size(value)
+            self._session_bytes += size
+            if old is not _MISSING:
+                self._session_bytes -= _approx_size(old)
+            if size > self.config.get("max_session_value_bytes", 64 * 1024) \
+                    and key not in self._size_warned:
+                self._size_warned.add(key)
+                LOG.warning(f"{self.skill_id} GUI session value '{key}' is "
+                            f"~{size} bytes, large values slow down every "
+                            f"sync of this key")
 
         # emit notification (but not needed if page has not been shown yet)
-        if self.page:
+        if self._current_page:
             self._sync_data()
 
     def __getitem__(self, key):
@@ -290,15 +661,18 @@ class GUIInterface:
         This method does not close the GUI for a Skill. For this purpose see
         the `release` method.
         """
-        self.__session_data = {}
-        self._pages = []
-        self.current_page_idx = -1
+        with self._lock:
+            self.__session_data = {}
+            self._dirty_keys.clear()
+            self._session_bytes = 0
+            self._pages = []
+            self.current_page_idx = -1
         if self.gui_disabled:
             return
-        if not self.bus:
-            raise RuntimeError("bus not set, did you call self.bind() ?")
-        self.bus.emit(Message("gui.clear.namespace",
-                              {"__from": self.skill_id}))
+        if not self._require_bus():
+            return
+        self._emit(Message("gui.clear.namespace",
+                          {"__from": self.skill_id}))
 
     def send_event(self, event_name: str,
                    params: Union[dict, list, str, int, float, bool] = None):
@@ -313,12 +687,12 @@ class GUIInterface:
         if self.gui_disabled:
             return
         params = params or {}
-        if not self.bus:
-            raise RuntimeError("bus not set, did you call self.bind() ?")
-        self.bus.emit(Message("gui.event.send",
-                              {"__from": self.skill_id,
-                               "event_name": event_name,
-                               "params": params}))
+        if not self._require_bus():
+            return
+        self._emit(Message("gui.event.send",
+                          {"__from": self.skill_id,
+                           "event_name": event_name,
+                           "params": params}))
 
     @staticmethod
     def _normalize_page_name(page_name: str) -> str:
@@ -327,15 +701,22 @@ class GUIInterface:
         @param page_name: string name of a GUI resource
         @return: normalized string name (`.qml` removed for other GUI support)
         """
-        if isfile(page_name):
-            raise ValueError("GUI resources should specify a resource name and not a file path.")
-        file, ext = splitext(page_name)
-        if ext == ".qml":
-            LOG.error("GUI resources should exclude gui-specific file "
-                      f"extensions. This call should probably pass "
-                      f"`{file}`, instead of `{page_name}`")
-            return file
-        return page_name
+        return _normalize_page_name(page_name)
+
+    def _normalize_page_names(self, page_names: List[str]) -> List[str]:
+        """
+        Validate and normalize the page names passed to
+        `show_pages` / `remove_pages`
+        @param page_names: page name or list of page resources
+        @return: list of normalized page names
+        """
+        if isinstance(page_names, str):
+            page_names = [page_names]
+        if not isinstance(page_names, list):
+            raise ValueError('page_names must be a list')
+        # `_normalize_page_name` rejects absolute paths and logs the '.qml'
+        # deprecation itself, it is cached so repeated names are cheap
+        return [_normalize_page_name(n) for n in page_names]
 
     # base gui interactions
     def show_page(self, name: str, override_idle: Union[bool, int] = None,
@@ -362,43 +743,39 @@ class GUIInterface:
             if True, override display indefinitely
         @param override_animations: if True, disables all GUI animations
         """
-        if not self.bus:
-            raise RuntimeError("bus not set, did you call self.bind() ?")
-        if isinstance(page_names, str):
-            page_names = [page_names]
-        if not isinstance(page_names, list):
-            raise ValueError('page_names must be a list')
+        if not self._require_bus():
+            return
+        page_names = self._normalize_page_names(page_names)
 
         if index > len(page_names):
             LOG.error('Default index is larger than page list length')
             index = len(page_names) - 1
 
-        if any(p.endswith(".qml") for p in page_names):
-            LOG.warning("received invalid page, please remove '.qml' extension from your code, "
-                        "this has been deprecated in ovos-gui and may stop working anytime")
-            page_names = [self._normalize_page_name(n) for n in page_names]
-
         if remove_others:
             self.remove_all_pages(except_pages=page_names)
 
-        self._pages = page_names
-        self.current_page_idx = index
+        with self._lock:
+            self._pages = page_names
+            self.current_page_idx = index
+            if self.gui_disabled:
+                return
+            self._sync_pending = False  # full snapshot sent below
+            self._dirty_keys.clear()
+            has_data = bool(self.__session_data)
+            data = {**self.__session_data, '__from': self.skill_id}
 
-        if self.gui_disabled:
-            return
         # First sync any data...
-        data = self.__session_data.copy()
-        data.update({'__from': self.skill_id})
-        LOG.debug(f"Updating gui data: {data}")
-        self.bus.emit(Message("gui.value.set", data))
+        if has_data:
+            LOG.debug("Updating gui data: %s", data)
+            self._emit(Message("gui.value.set", data))
 
         # finally tell gui what to show
-        self.bus.emit(Message("gui.page.show",
-                              {"page_names": page_names,
-                               "index": index,
-                               "__from": self.skill_id,
-                               "__idle": override_idle,
-                               "__animations": override_animations}))
+        self._emit(Message("gui.page.show",
+                          {"page_names": page_names,
+                           "index": index,
+                           "__from": self.skill_id,
+                           "__idle": override_idle,
+                           "__animations": override_animations}))
 
     def remove_page(self, page: str):
         """
@@ -414,20 +791,13 @@ class GUIInterface:
         """
         if self.gui_disabled:
             return
-        if not self.bus:
-            raise RuntimeError("bus not set, did you call self.bind() ?")
-        if isinstance(page_names, str):
-            page_names = [page_names]
-        if not isinstance(page_names, list):
-            raise ValueError('page_names must be a list')
-        if any(p.endswith(".qml") for p in page_names):
-            LOG.warning("received invalid page, please remove '.qml' extension from your code, "
-                        "this has been deprecated in ovos-gui and may stop working anytime")
-            page_names = [self._normalize_page_name(n) for n in page_names]
+        if not self._require_bus():
+            return
+        page_names = self._normalize_page_names(page_names)
 
-        self.bus.emit(Message("gui.page.delete",
-                              {"page_names": page_names,
-                               "__from": self.skill_id}))
+        self._emit(Message("gui.page.delete",
+                          {"page_names": page_names,
+                           "__from": self.skill_id}))
 
     def remove_all_pages(self, except_pages=None):
         """
@@ -436,14 +806,27 @@ class GUIInterface:
         """
         if self.gui_disabled:
             return
-        if not self.bus:
-            raise RuntimeError("bus not set, did you call self.bind() ?")
-        self.bus.emit(Message("gui.page.delete.all",
-                              {"__from": self.skill_id,
-                               "except": except_pages or []}))
+        if not self._require_bus():
+            return
+        self._emit(Message("gui.page.delete.all",
+                          {"__from": self.skill_id,
+                           "except": except_pages or []}))
 
-    # Utils / Templates
+    def _show_with_data(self, page: str, session_updates: dict,
+                        override_idle: Union[int, bool] = None,
+                        override_animations: bool = False):
+        """
+        Update session data and show a page as one operation, the changes
+        are sent with the page snapshot instead of one message per key
+        @param page: name of the page to show
+        @param session_updates: session keys to set before showing the page
+        """
+        with self.batch_update():
+            for key, value in session_updates.items():
+                self[key] = value
+            self.show_page(page, override_idle, override_animations)
 
+    # Utils / Templates
     # backport - PR https://github.com/MycroftAI/mycroft-core/pull/2862
     def show_notification(self, content: str, duration: int = 10,
                           action: str = None, noticetype: str = "transient",
@@ -467,21 +850,21 @@ class GUIInterface:
             callback_data (dict): data dictionary available to use with action
         """
         # TODO: Define enums for style and noticetype
-        if not self.bus:
-            raise RuntimeError("bus not set, did you call self.bind() ?")
+        if not self._require_bus():
+            return
         # GUI does not accept NONE type, send an empty dict
         # Sending NONE will corrupt entries in the model
         callback_data = callback_data or dict()
-        self.bus.emit(Message("ovos.notification.api.set",
-                              data={
-                                  "duration": duration,
-                                  "sender": self.skill_id,
-                                  "text": content,
-                                  "action": action,
-                                  "type": noticetype,
-                                  "style": style,
-                                  "callback_data": callback_data
-                              }))
+        self._emit(Message("ovos.notification.api.set",
+                          data={
+                              "duration": duration,
+                              "sender": self.skill_id,
+                              "text": content,
+                              "action": action,
+                              "type": noticetype,
+                              "style": style,
+                              "callback_data": callback_data
+                          }))
 
     def show_controlled_notification(self, content: str, style: str = "info"):
         """
@@ -496,22 +879,22 @@ class GUIInterface:
                 error: displays a notification with error styling
         """
         # TODO: Define enum for style
-        if not self.bus:
-            raise RuntimeError("bus not set, did you call self.bind() ?")
-        self.bus.emit(Message("ovos.notification.api.set.controlled",
-                              data={
-                                  "sender": self.skill_id,
-                                  "text": content,
-                                  "style": style
-                              }))
+        if not self._require_bus():
+            return
+        self._emit(Message("ovos.notification.api.set.controlled",
+                          data={
+                              "sender": self.skill_id,
+                              "text": content,
+                              "style": style
+                          }))
 
     def remove_controlled_notification(self):
         """
         Remove a controlled Notification in the GUI.
         """
-        if not self.bus:
-            raise RuntimeError("bus not set, did you call self.bind() ?")
-        self.bus.emit(Message("ovos.notification.api.remove.controlled"))
+        if not self._require_bus():
+            return
+        self._emit(Message("ovos.notification.api.remove.controlled"))
 
     def show_face(self, awake: bool = True,
                   override_idle: Union[int, bool] = True,
@@ -529,8 +912,8 @@ class GUIInterface:
                 True: Disables showing all platform skill animations.
                 False: 'Default' always show animations.
         """
-        self["sleeping"] = not awake
-        self.show_page("SYSTEM_Face", override_idle, override_animations)
+        self._show_with_data("SYSTEM_Face", {"sleeping": not awake},
+                             override_idle, override_animations)
 
     def show_loading_animation(self, text: str,
                                override_idle: Union[int, bool] = None,
@@ -548,8 +931,8 @@ class GUIInterface:
                 True: Disables showing all platform skill animations.
                 False: 'Default' always show animations.
         """
-        self["label"] = text
-        self.show_page("SYSTEM_Loading", override_idle, override_animations)
+        self._show_with_data("SYSTEM_Loading", {"label": text},
+                             override_idle, override_animations)
 
     def show_status_animation(self, text: str, success: bool,
                               override_idle: Union[int, bool] = None,
@@ -568,9 +951,10 @@ class GUIInterface:
                 True: Disables showing all platform skill animations.
                 False: 'Default' always show animations.
         """
-        self["status"] = "Enabled" if success else "Disabled"  # string check in QML
-        self["label"] = text
-        self.show_page("SYSTEM_Status", override_idle, override_animations)
+        self._show_with_data("SYSTEM_Status",
+                             {"status": "Enabled" if success else "Disabled",  # string check in QML
+                              "label": text},
+                             override_idle, override_animations)
 
     def show_text(self, text: str, title: Optional[str] = None,
                   override_idle: Union[int, bool] = None,
@@ -589,10 +973,9 @@ class GUIInterface:
                 True: Disables showing all platform skill animations.
                 False: 'Default' always show animations.
         """
-        self["text"] = text
-        self["title"] = title
-        self.show_page("SYSTEM_TextFrame", override_idle,
-                       override_animations)
+        self._show_with_data("SYSTEM_TextFrame",
+                             {"text": text, "title": title},
+                             override_idle, override_animations)
 
     def _resolve_url(self, url: str) -> str:
         """Resolve a URL to a valid file path.
@@ -612,18 +995,15 @@ class GUIInterface:
             return url
 
         if not os.path.isfile(url):
-            GUI_CACHE_PATH = get_xdg_cache_save_path('ovos_gui')
-            # Use os.path.join for path construction
-            gui_cache = os.path.join(GUI_CACHE_PATH, self.skill_id, url)
-            if os.path.isfile(gui_cache):
-                LOG.debug(f"Resolved image: {gui_cache}")
-                return gui_cache
-            else:
-                for framework in self.ui_directories:
-                    gui_cache = os.path.join(GUI_CACHE_PATH, self.skill_id, framework, url)
-                    if os.path.isfile(gui_cache):
-                        LOG.debug(f"Resolved image: {gui_cache}")
-                        return gui_cache
+            # this path is hardcoded in ovos_gui.constants and follows XDG
+            # spec, resolved per call so XDG_CACHE_HOME changes are honored
+            cache_root = get_xdg_cache_save_path('ovos_gui')
+            for cache_dir in _gui_cache_dirs(cache_root, self.skill_id,
+                                             tuple(self.ui_directories)):
+                gui_cache = os.path.join(cache_dir, url)
+                if os.path.isfile(gui_cache):
+                    LOG.debug(f"Resolved image: {gui_cache}")
+                    return gui_cache
         return url
 
     def show_image(self, url: str, caption: Optional[str] = None,
@@ -654,13 +1034,13 @@ class GUIInterface:
         if not url.startswith("http") and not os.path.isfile(url):
             LOG.error(f"Provided image file does not exist! '{url}'")
             return
-        self["image"] = url
-        self["title"] = title
-        self["caption"] = caption
-        self["fill"] = fill
-        self["background_color"] = background_color
-        self.show_page("SYSTEM_ImageFrame", override_idle,
-                       override_animations)
+        self._show_with_data("SYSTEM_ImageFrame",
+                             {"image": url,
+                              "title": title,
+                              "caption": caption,
+                              "fill": fill,
+                              "background_color": background_color},
+                             override_idle, override_animations)
 
     def show_animated_image(self, url: str, caption: Optional[str] = None,
                             title: Optional[str] = None,
@@ -690,13 +1070,13 @@ class GUIInterface:
         if not url.startswith("http") and not os.path.isfile(url):
             LOG.error(f"Provided image file does not exist! '{url}'")
             return
-        self["image"] = url
-        self["title"] = title
-        self["caption"] = caption
-        self["fill"] = fill
-        self["background_color"] = background_color
-        self.show_page("SYSTEM_AnimatedImageFrame", override_idle,
-                       override_animations)
+        self._show_with_data("SYSTEM_AnimatedImageFrame",
+                             {"image": url,
+                              "title": title,
+                              "caption": caption,
+                              "fill": fill,
+                              "background_color": background_color},
+                             override_idle, override_animations)
 
     def show_html(self, html: str, resource_url: Optional[str] = None,
                   override_idle: Union[int, bool] = None,
@@ -715,10 +1095,9 @@ class GUIInterface:
                 True: Disables showing all platform skill animations.
                 False: 'Default' always show animations.
         """
-        self["html"] = html
-        self["resourceLocation"] = resource_url
-        self.show_page("SYSTEM_HtmlFrame", override_idle,
-                       override_animations)
+        self._show_with_data("SYSTEM_HtmlFrame",
+                             {"html": html, "resourceLocation": resource_url},
+                             override_idle, override_animations)
 
     def show_url(self, url: str, override_idle: Union[int, bool] = None,
                  override_animations: bool = False):
@@ -735,9 +1114,8 @@ class GUIInterface:
                 True: Disables showing all platform skill animations.
                 False: 'Default' always show animations.
         """
-        self["url"] = url
-        self.show_page("SYSTEM_UrlFrame", override_idle,
-                       override_animations)
+        self._show_with_data("SYSTEM_UrlFrame", {"url": url},
+                             override_idle, override_animations)
 
     def show_input_box(self, title: Optional[str] = None,
                        placeholder: Optional[str] = None,
@@ -755,21 +1133,13 @@ class GUIInterface:
             else Delays resting page for the specified number of seconds.
         @param override_animations: disable showing all platform animations
         """
-        self["title"] = title
-        self["placeholder"] = placeholder
-        self["skill_id_handler"] = self.skill_id
-        if not confirm_text:
-            self["confirm_text"] = "Confirm"
-        else:
-            self["confirm_text"] = confirm_text
-
-        if not exit_text:
-            self["exit_text"] = "Exit"
-        else:
-            self["exit_text"] = exit_text
-
-        self.show_page("SYSTEM_InputBox", override_idle,
-                       override_animations)
+        self._show_with_data("SYSTEM_InputBox",
+                             {"title": title,
+                              "placeholder": placeholder,
+                              "skill_id_handler": self.skill_id,
+                              "confirm_text": confirm_text or "Confirm",
+                              "exit_text": exit_text or "Exit"},
+                             override_idle, override_animations)
 
     def remove_input_box(self):
         """
@@ -788,11 +1158,11 @@ class GUIInterface:
         Also calls self.clear() to reset the state variables
         Platforms can close the window or go back to previous page
         """
-        if not self.bus:
-            raise RuntimeError("bus not set, did you call self.bind() ?")
+        if not self._require_bus():
+            return
         self.clear()
-        self.bus.emit(Message("mycroft.gui.screen.close",
-                              {"skill_id": self.skill_id}))
+        self._emit(Message("mycroft.gui.screen.close",
+                          {"skill_id": self.skill_id}))
 
     def shutdown(self):
         """
@@ -802,5 +1172,7 @@ class GUIInterface:
         """
         if self.bus:
             self.release()
-            for event, handler in self._events:
-                self.bus.remove(event, handler)
+            for event, handlers in self._events.items():
+                for handler in handlers:
+                    self.bus.remove(event, handler)
+        self._events.clear()
@@ -10,21 +10,43 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import os
+import sys
 import warnings
 import time
 from datetime import timedelta
-from functools import wraps
-from os.path import abspath
-from threading import Lock
-from typing import List, Union, Optional
+from os.path import isabs, join, normpath
+from threading import Event, Lock, Timer
+from typing import List, Tuple, Union, Optional
+from uuid import uuid4
+from weakref import WeakKeyDictionary
 
 from ovos_utils.gui import is_gui_connected, is_gui_running
 from ovos_utils.log import LOG, deprecated
 
+from ovos_bus_client.client.waiter import MessageWaiter
 from ovos_bus_client.message import Message
 from ovos_bus_client.message import dig_for_message
 from ovos_bus_client.util import get_mycroft_bus
 
+try:
+    from ovos_utils.ocp import (Playlist, MediaEntry, PluginStream,
+                                dict2entry, PlaybackMode, MediaType)
+    _OCP_AVAILABLE = True
+except ImportError:  # ovos-utils < 0.1
+    from enum import IntEnum
+
+    class MediaType(IntEnum):
+        GENERIC = 0  # nothing else matches
+
+    Playlist = MediaEntry = PluginStream = dict2entry = PlaybackMode = None
+    _OCP_AVAILABLE = False
+
+
+def _require_ocp():
+    if not _OCP_AVAILABLE:
+        raise RuntimeError("This method requires ovos-utils ~=0.1")
+
 
 def ensure_uri(s: str):
     """
@@ -36,44 +58,180 @@ def ensure_uri(s: str):
     Returns:
         if s is uri, s is returned otherwise file:// is prepended
     """
-    if isinstance(s, str):
-        if ':' not in s:
-            return 'file://' + abspath(s)
-        else:
-            return s
-    elif isinstance(s, (tuple, list)):  # Handle (mime, uri) arg
-        if ':' not in s[0]:
-            return 'file://' + abspath(s[0]), s[1]
+    return ensure_uris([s])[0]
+
+
+def ensure_uris(tracks: list) -> list:
+    """
+    Interpret paths as file:// uri's, see `ensure_uri`, for a list of
+    tracks in a single pass
+
+    Args:
+        tracks: list of track uri's or (uri, mime) tuples
+
+    Returns:
+        list of uri's / (uri, mime) tuples
+    """
+    cwd = None  # looked up once, only if there are relative paths
+
+    def _file_uri(path):
+        nonlocal cwd
+        if not isabs(path):
+            cwd = cwd or os.getcwd()
+            path = join(cwd, path)
+        return 'file://' + normpath(path)
+
+    normalized = []
+    for t in tracks:
+        if isinstance(t, str):
+            normalized.append(t if ':' in t else _file_uri(t))
+        elif isinstance(t, (tuple, list)):  # Handle (mime, uri) arg
+            normalized.append(t if ':' in t[0] else (_file_uri(t[0]), t[1]))
         else:
-            return s
-    else:
-        raise ValueError('Invalid track')
+            raise ValueError('Invalid track')
+    return normalized
+
 
+def _to_seconds(seconds: Union[int, float, timedelta]) -> Union[int, float]:
+    """accept timedelta anywhere a number of seconds is expected"""
+    if isinstance(seconds, timedelta):
+        return seconds.total_seconds()
+    return seconds
 
-def _ensure_message_kwarg():
-    """ensure message kwarg is present
-    NOTE: this is meant for usage only in this module, it is not a generic decorator!
+
+_GUI_STATE_TTL = 5  # seconds a GUI availability check is reused for
+_gui_state = WeakKeyDictionary()  # bus -> (time.monotonic(), has_gui)
+
+
+def _has_gui(bus) -> bool:
     """
+    Check if a GUI is running or connected, the answer is cached per bus
+    for a few seconds since checking may need a bus round-trip
+    """
+    try:
+        cached = _gui_state.get(bus)
+    except TypeError:  # None or not weak referenceable, can't be cached
+        return is_gui_running() or is_gui_connected(bus)
+    now = time.monotonic()
+    if cached and now - cached[0] < _GUI_STATE_TTL:
+        return cached[1]
+    has_gui = is_gui_running() or is_gui_connected(bus)
+    _gui_state[bus] = (now, has_gui)
+    return has_gui
+
+
+def _normalize_tracks(tracks) -> list:
+    """
+    Validate a track or list of tracks and interpret paths as file:// uri's
+
+    Args:
+        tracks: track uri, (uri, mime) tuple or a list of those
+
+    Returns:
+        list of track uri's / (uri, mime) tuples
+    """
+    tracks = tracks or []
+    if isinstance(tracks, (str, tuple)):
+        tracks = [tracks]
+    elif not isinstance(tracks, list):
+        raise ValueError
+    return ensure_uris(tracks)
+
 
-    def message_injector(func):
-        # this method ensures all skills messages are .forward from the utterance
-        # that triggered the skill, this ensures proper routing and metadata in message.context
-        @wraps(func)
-        def call_function(*args, **kwargs):
-            if not any([isinstance(a, Message) for a in args]):
-                m = kwargs.get("source_message")
-                if not m:
-                    source_message = dig_for_message(max_records=50)
-                    if source_message:
-                        kwargs["source_message"] = source_message
-                    else:
-                        LOG.warning("source message could not be determined, message.context has been lost!")
-                        kwargs["source_message"] = Message("")
-            return func(*args, **kwargs)
+def _resolve_source_message(source_message: Optional[Message] = None) -> Message:
+    """
+    Find the message that triggered an API call, so emitted messages can be
+    .forward'ed from the utterance that triggered the skill, this ensures
+    proper routing and metadata in message.context
+    NOTE: this is meant for usage only in this module
+    """
+    if source_message is not None:
+        return source_message
+    source_message = dig_for_message(max_records=50)
+    if source_message:
+        return source_message
+    LOG.warning("source message could not be determined, message.context has been lost!")
+    return Message("")
+
+
+def _norm_track(track):
+    """isinstance based normalization, used for subclasses of the OCP types"""
+    if isinstance(track, dict):
+        return dict2entry(track)
+    if isinstance(track, PluginStream):
+        # TODO - this method will be deprecated
+        #  once all SEI parsers can handle the new objects
+        #  this module can serialize them just fine,
+        #  but we dont know who is listening
+        return track.as_media_entry
+    if isinstance(track, list) and not isinstance(track, Playlist):
+        return OCPInterface.norm_tracks(track)
+    if not isinstance(track, (Playlist, MediaEntry)):
+        # TODO - support string uris
+        # let it fail in next assert
+        # log all bad entries before failing
+        LOG.error(f"Bad track, invalid type: {track}")
+    return track
+
+
+# exact type -> normalizer, a single dict lookup for the common track types
+_NORM_DISPATCH = {}
+if _OCP_AVAILABLE:
+    _NORM_DISPATCH = {
+        MediaEntry: lambda t: t,
+        Playlist: lambda t: t,
+        dict: dict2entry,
+        PluginStream: lambda t: t.as_media_entry,
+        list: lambda t: OCPInterface.norm_tracks(t)
+    }
+
+
+class _SeekCoalescer:
+    """
+    Merge relative seeks requested within `window` seconds of each other
+    into a single seek by the net amount, e.g. bursts from a UI scrubber
 
-        return call_function
+    with the default window of 0 every seek is sent right away
+    """
 
-    return message_injector
+    def __init__(self, emit_seek, window: float = 0.0):
+        self._emit_seek = emit_seek  # callable(seconds, source_message)
+        self.window = window
+        self._seconds = 0
+        self._message = None
+        self._timer = None
+        self._lock = Lock()
+
+    def add(self, seconds: float, source_message: Message):
+        if self.window <= 0:
+            self._emit_seek(seconds, source_message)
+            return
+        with self._lock:
+            self._seconds += seconds
+            self._message = source_message
+            if self._timer is None:
+                self._timer = Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """send the pending seek now, if any"""
+        with self._lock:
+            seconds, message = self._seconds, self._message
+            self._seconds, self._message = 0, None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if seconds:
+            self._emit_seek(seconds, message)
+
+    def discard(self):
+        """drop the pending seek, e.g. superseded by an absolute position"""
+        with self._lock:
+            self._seconds, self._message = 0, None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
 
 
 class ClassicAudioServiceInterface:
@@ -89,11 +247,13 @@ class ClassicAudioServiceInterface:
 
     Args:
         bus: OpenVoiceOS messagebus connection
+        seek_window: seconds to merge consecutive relative seeks for,
+            0 sends every seek right away
     """
 
     @deprecated("removed from ovos-audio with the adoption of ovos-media service, "
                 "use OCPInterface instead", "0.1.0")
-    def __init__(self, bus=None):
+    def __init__(self, bus=None, seek_window: float = 0.0):
 
         warnings.warn(
             "use OCPInterface instead",
@@ -101,8 +261,20 @@ class ClassicAudioServiceInterface:
             stacklevel=2,
         )
         self.bus = bus or get_mycroft_bus()
+        self._seeks = _SeekCoalescer(self._emit_seek, seek_window)
+
+    def _emit_seek(self, seconds: float, source_message: Message):
+        if seconds < 0:
+            self.bus.emit(source_message.forward('mycroft.audio.service.seek_backward',
+                                                 {"seconds": abs(seconds)}))
+        else:
+            self.bus.emit(source_message.forward('mycroft.audio.service.seek_forward',
+                                                 {"seconds": seconds}))
+
+    def _emit_simple(self, msg_type: str, source_message: Optional[Message] = None):
+        """emit a message without data, forwarded from the source message"""
+        self.bus.emit(_resolve_source_message(source_message).forward(msg_type))
 
-    @_ensure_message_kwarg()
     def queue(self, tracks=None, source_message: Optional[Message] = None):
         """Queue up a track to playing playlist.
 
@@ -112,16 +284,26 @@ class ClassicAudioServiceInterface:
                     to give a hint of the mime type to the system
             source_message: bus message that triggered this action
         """
-        tracks = tracks or []
-        if isinstance(tracks, (str, tuple)):
-            tracks = [tracks]
-        elif not isinstance(tracks, list):
-            raise ValueError
-        tracks = [ensure_uri(t) for t in tracks]
+        source_message = _resolve_source_message(source_message)
+        tracks = _normalize_tracks(tracks)
+        self.bus.emit(source_message.forward('mycroft.audio.service.queue',
+                                             {'tracks': tracks}))
+
+    def queue_many(self, playlists: list,
+                   source_message: Optional[Message] = None):
+        """Queue up several playlists with a single bus message.
+
+        Args:
+            playlists: list of track lists, see `queue`
+            source_message: bus message that triggered this action
+        """
+        source_message = _resolve_source_message(source_message)
+        tracks = []
+        for playlist in playlists:
+            tracks += _normalize_tracks(playlist)
         self.bus.emit(source_message.forward('mycroft.audio.service.queue',
                                              {'tracks': tracks}))
 
-    @_ensure_message_kwarg()
     def play(self, tracks=None, utterance=None, repeat=None, source_message: Optional[Message] = None):
         """Start playback.
 
@@ -134,61 +316,52 @@ class ClassicAudioServiceInterface:
             repeat: if the playback should be looped
             source_message: bus message that triggered this action
         """
+        source_message = _resolve_source_message(source_message)
         repeat = repeat or False
-        tracks = tracks or []
         utterance = utterance or ''
-        if isinstance(tracks, (str, tuple)):
-            tracks = [tracks]
-        elif not isinstance(tracks, list):
-            raise ValueError
-        tracks = [ensure_uri(t) for t in tracks]
+        tracks = _normalize_tracks(tracks)
         self.bus.emit(source_message.forward('mycroft.audio.service.play',
                                              {'tracks': tracks,
                                               'utterance': utterance,
                                               'repeat': repeat}))
 
-    @_ensure_message_kwarg()
     def stop(self, source_message: Optional[Message] = None):
         """Stop the track.
          Args:
             source_message: bus message that triggered this action"""
-        self.bus.emit(source_message.forward('mycroft.audio.service.stop'))
+        self._emit_simple('mycroft.audio.service.stop', source_message)
 
-    @_ensure_message_kwarg()
     def next(self, source_message: Optional[Message] = None):
         """Change to next track.
          Args:
             source_message: bus message that triggered this action"""
-        self.bus.emit(source_message.forward('mycroft.audio.service.next'))
+        self._emit_simple('mycroft.audio.service.next', source_message)
 
-    @_ensure_message_kwarg()
     def prev(self, source_message: Optional[Message] = None):
         """Change to previous track.
          Args:
             source_message: bus message that triggered this action"""
-        self.bus.emit(source_message.forward('mycroft.audio.service.prev'))
+        self._emit_simple('mycroft.audio.service.prev', source_message)
 
-    @_ensure_message_kwarg()
     def pause(self, source_message: Optional[Message] = None):
         """Pause playback.
          Args:
             source_message: bus message that triggered this action"""
-        self.bus.emit(source_message.forward('mycroft.audio.service.pause'))
+        self._emit_simple('mycroft.audio.service.pause', source_message)
 
-    @_ensure_message_kwarg()
     def resume(self, source_message: Optional[Message] = None):
         """Resume paused playback.
          Args:
             source_message: bus message that triggered this action"""
-        self.bus.emit(source_message.forward('mycroft.audio.service.resume'))
+        self._emit_simple('mycroft.audio.service.resume', source_message)
 
-    @_ensure_message_kwarg()
     def get_track_length(self, source_message: Optional[Message] = None):
         """
         getting the duration of the audio in seconds
          Args:
             source_message: bus message that triggered this action
         """
+        source_message = _resolve_source_message(source_message)
         length = 0
         info = self.bus.wait_for_response(
             source_message.forward('mycroft.audio.service.get_track_length'),
@@ -197,13 +370,13 @@ class ClassicAudioServiceInterface:
             length = info.data.get("length") or 0
         return length / 1000  # convert to seconds
 
-    @_ensure_message_kwarg()
     def get_track_position(self, source_message: Optional[Message] = None):
         """
         get current position in seconds
          Args:
             source_message: bus message that triggered this action
         """
+        source_message = _resolve_source_message(source_message)
         pos = 0
         info = self.bus.wait_for_response(
             source_message.forward('mycroft.audio.service.get_track_position'),
@@ -212,7 +385,6 @@ class ClassicAudioServiceInterface:
             pos = info.data.get("position") or 0
         return pos / 1000  # convert to seconds
 
-    @_ensure_message_kwarg()
     def set_track_position(self, seconds, source_message: Optional[Message] = None):
         """Seek X seconds.
 
@@ -220,10 +392,16 @@ class ClassicAudioServiceInterface:
             seconds (int): number of seconds to seek, if negative rewind
             source_message: bus message that triggered this action
         """
+        source_message = _resolve_source_message(source_message)
+        self._seeks.discard()
         self.bus.emit(source_message.forward('mycroft.audio.service.set_track_position',
-                                             {"position": seconds * 1000}))  # convert to ms
+                                             {"position": round(seconds * 1000)}))  # convert to ms
+
+    def flush_seek(self):
+        """send any seek still being merged by seek_window right away,
+        e.g. when the user releases a scrubber"""
+        self._seeks.flush()
 
-    @_ensure_message_kwarg()
     def seek(self, seconds: Union[int, float, timedelta] = 1,
              source_message: Optional[Message] = None):
         """Seek X seconds.
@@ -232,14 +410,10 @@ class ClassicAudioServiceInterface:
             seconds (int): number of seconds to seek, if negative rewind
             source_message: bus message that triggered this action
         """
-        if isinstance(seconds, timedelta):
-            seconds = seconds.total_seconds()
-        if seconds < 0:
-            self.seek_backward(abs(seconds), source_message=source_message)
-        else:
-            self.seek_forward(seconds, source_message=source_message)
+        source_message = _resolve_source_message(source_message)
+        # normalized once, the coalescer picks forward/backward by sign
+        self._seeks.add(_to_seconds(seconds), source_message)
 
-    @_ensure_message_kwarg()
     def seek_forward(self, seconds: Union[int, float, timedelta] = 1,
                      source_message: Optional[Message] = None):
         """Skip ahead X seconds.
@@ -248,12 +422,10 @@ class ClassicAudioServiceInterface:
             seconds (int): number of seconds to skip
             source_message: bus message that triggered this action
         """
-        if isinstance(seconds, timedelta):
-            seconds = seconds.total_seconds()
-        self.bus.emit(source_message.forward('mycroft.audio.service.seek_forward',
-                                             {"seconds": seconds}))
+        source_message = _resolve_source_message(source_message)
+        seconds = _to_seconds(seconds)
+        self._seeks.add(seconds, source_message)
 
-    @_ensure_message_kwarg()
     def seek_backward(self, seconds: Union[int, float, timedelta] = 1, source_message: Optional[Message] = None):
         """Rewind X seconds
 
@@ -261,12 +433,10 @@ class ClassicAudioServiceInterface:
             seconds (int): number of seconds to rewind
             source_message: bus message that triggered this action
         """
-        if isinstance(seconds, timedelta):
-            seconds = seconds.total_seconds()
-        self.bus.emit(source_message.forward('mycroft.audio.service.seek_backward',
-                                             {"seconds": seconds}))
+        source_message = _resolve_source_message(source_message)
+        seconds = _to_seconds(seconds)
+        self._seeks.add(-seconds, source_message)
 
-    @_ensure_message_kwarg()
     def track_info(self, source_message: Optional[Message] = None):
         """Request information of current playing track.
          Args:
@@ -275,13 +445,13 @@ class ClassicAudioServiceInterface:
         Returns:
             Dict with track info.
         """
+        source_message = _resolve_source_message(source_message)
         info = self.bus.wait_for_response(
             source_message.forward('mycroft.audio.service.track_info'),
             reply_type='mycroft.audio.service.track_info_reply',
             timeout=1)
         return info.data if info else {}
 
-    @_ensure_message_kwarg()
     def available_backends(self, source_message: Optional[Message] = None):
         """Return available audio backends.
          Args:
@@ -290,6 +460,7 @@ class ClassicAudioServiceInterface:
         Returns:
             dict with backend names as keys
         """
+        source_message = _resolve_source_message(source_message)
         m = source_message.forward('mycroft.audio.service.list_backends')
         response = self.bus.wait_for_response(m)
         return response.data if response else {}
@@ -304,42 +475,38 @@ class OCPInterface:
     """bus api interface for OCP subsystem
     Args:
         bus: OpenVoiceOS messagebus connection
+        seek_window: seconds to merge consecutive relative seeks for,
+            0 sends every seek right away
     """
 
-    def __init__(self, bus=None):
+    def __init__(self, bus=None, seek_window: float = 0.0):
         self.bus = bus or get_mycroft_bus()
+        self._seeks = _SeekCoalescer(self._emit_seek, seek_window)
+
+    def _emit_seek(self, seconds: float, source_message: Message):
+        self.bus.emit(source_message.forward('ovos.common_play.seek',
+                                             {"seconds": seconds}))
+
+    def _emit_simple(self, msg_type: str, source_message: Optional[Message] = None):
+        """emit a message without data, forwarded from the source message"""
+        self.bus.emit(_resolve_source_message(source_message).forward(msg_type))
 
     # OCP bus api
     @staticmethod
     def norm_tracks(tracks: list):
-        try:
-            from ovos_utils.ocp import Playlist, MediaEntry, PluginStream, dict2entry
-        except ImportError as e:
-            raise RuntimeError("This method requires ovos-utils ~=0.1") from e
-
         """ensures a list of tracks contains only MediaEntry or Playlist items"""
+        _require_ocp()
         assert isinstance(tracks, list)
+        if all(type(t) is dict for t in tracks):
+            # plain search results, skip the per track dispatch
+            tracks[:] = map(dict2entry, tracks)
+            return tracks
         # support Playlist and MediaEntry objects in tracks
         for idx, track in enumerate(tracks):
-            if isinstance(track, dict):
-                tracks[idx] = dict2entry(track)
-            if isinstance(track, PluginStream):
-                # TODO - this method will be deprecated
-                #  once all SEI parsers can handle the new objects
-                #  this module can serialize them just fine,
-                #  but we dont know who is listening
-                tracks[idx] = track.as_media_entry
-            elif isinstance(track, list) and not isinstance(track, Playlist):
-                tracks[idx] = OCPInterface.norm_tracks(track)
-            elif not isinstance(track, (Playlist, MediaEntry)):
-                # TODO - support string uris
-                # let it fail in next assert
-                # log all bad entries before failing
-                LOG.error(f"Bad track, invalid type: {track}")
+            tracks[idx] = _NORM_DISPATCH.get(type(track), _norm_track)(track)
         assert all(isinstance(t, (MediaEntry, Playlist, PluginStream)) for t in tracks)
         return tracks
 
-    @_ensure_message_kwarg()
     def queue(self, tracks: list, source_message: Optional[Message] = None):
         """Queue up a track to OCP playing playlist.
 
@@ -347,11 +514,11 @@ class OCPInterface:
             tracks: track dict or list of track dicts (OCP result style)
             source_message: bus message that triggered this action
         """
+        source_message = _resolve_source_message(source_message)
         tracks = self.norm_tracks(tracks)
         self.bus.emit(source_message.forward('ovos.common_play.playlist.queue',
                                              {'tracks': tracks}))
 
-    @_ensure_message_kwarg()
     def populate_search_results(self, tracks: list,
                                 replace: bool = True,
                                 sort_by_conf: bool = True,
@@ -362,12 +529,12 @@ class OCPInterface:
             replace: if False, extend existing search, if True replace current search results
             source_message: bus message that triggered this action
         """
+        source_message = _resolve_source_message(source_message)
         tracks = self.norm_tracks(tracks)
         self.bus.emit(source_message.forward('ovos.common_play.search.populate',
                                              {"playlist": [t.as_dict for t in tracks],
                                               "replace": replace, "sort_by_conf": sort_by_conf}))
 
-    @_ensure_message_kwarg()
     def play(self, tracks: list, utterance=None, source_message: Optional[Message] = None):
         """Start playback.
         Args:
@@ -375,91 +542,91 @@ class OCPInterface:
             utterance: forward utterance for further processing by OCP
             source_message: bus message that triggered this action
         """
+        source_message = _resolve_source_message(source_message)
         tracks = self.norm_tracks(tracks)
         utterance = utterance or ''
-        playlist = tracks
-        disambiguation = []
-        try:
-            from ovos_utils.ocp import Playlist, MediaEntry, PluginStream, dict2entry
-            if isinstance(tracks[0], Playlist):
-                playlist = tracks[0]
-                disambiguation = tracks
-        except ImportError as e:
-            LOG.warning("can't handle Playlist results properly, please update ovos-utils to >= 0.1.0")
-
-        media = playlist[0]
+        # as_dict builds a new dict every call, the media entry is the
+        # first playlist item so it is only converted once
+        if isinstance(tracks[0], Playlist):
+            disambiguation = [t.as_dict for t in tracks]
+            if all(isinstance(t, (MediaEntry, PluginStream)) for t in tracks[0]):
+                # the first Playlist dict already holds its serialized
+                # entries, copied so the two payload keys do not share it
+                playlist = list(disambiguation[0]["playlist"])
+            else:
+                # Playlist.as_dict drops nested playlists, keep them here
+                playlist = [t.as_dict for t in tracks[0]]
+        else:
+            disambiguation = []
+            playlist = [t.as_dict for t in tracks]
         self.bus.emit(source_message.forward('ovos.common_play.play',
-                                             {"media": media.as_dict,
-                                              "playlist": [t.as_dict for t in playlist],
-                                              "disambiguation": [t.as_dict for t in disambiguation],
+                                             {"media": playlist[0],
+                                              "playlist": playlist,
+                                              "disambiguation": disambiguation,
                                               "utterance": utterance}))
 
-    @_ensure_message_kwarg()
     def stop(self, source_message: Optional[Message] = None):
         """Stop the track.
          Args:
             source_message: bus message that triggered this action"""
-        self.bus.emit(source_message.forward("ovos.common_play.stop"))
+        self._emit_simple("ovos.common_play.stop", source_message)
 
-    @_ensure_message_kwarg()
     def next(self, source_message: Optional[Message] = None):
         """Change to next track.
          Args:
             source_message: bus message that triggered this action"""
-        self.bus.emit(source_message.forward("ovos.common_play.next"))
+        self._emit_simple("ovos.common_play.next", source_message)
 
-    @_ensure_message_kwarg()
     def prev(self, source_message: Optional[Message] = None):
         """Change to previous track.
          Args:
             source_message: bus message that triggered this action"""
-        self.bus.emit(source_message.forward("ovos.common_play.previous"))
+        self._emit_simple("ovos.common_play.previous", source_message)
 
-    @_ensure_message_kwarg()
     def pause(self, source_message: Optional[Message] = None):
         """Pause playback.
          Args:
             source_message: bus message that triggered this action"""
-        self.bus.emit(source_message.forward("ovos.common_play.pause"))
+        self._emit_simple("ovos.common_play.pause", source_message)
 
-    @_ensure_message_kwarg()
     def resume(self, source_message: Optional[Message] = None):
         """Resume paused playback.
          Args:
             source_message: bus message that triggered this action"""
-        self.bus.emit(source_message.forward("ovos.common_play.resume"))
+        self._emit_simple("ovos.common_play.resume", source_message)
+
+    def flush_seek(self):
+        """send any seek still being merged by seek_window right away,
+        e.g. when the user releases a scrubber"""
+        self._seeks.flush()
 
-    @_ensure_message_kwarg()
     def seek_forward(self, seconds=1, source_message: Optional[Message] = None):
         """Skip ahead X seconds.
         Args:
             seconds (int): number of seconds to skip
             source_message: bus message that triggered this action
         """
-        if isinstance(seconds, timedelta):
-            seconds = seconds.total_seconds()
-        self.bus.emit(source_message.forward('ovos.common_play.seek',
-                                             {"seconds": seconds}))
+        source_message = _resolve_source_message(source_message)
+        seconds = _to_seconds(seconds)
+        self._seeks.add(seconds, source_message)
 
-    @_ensure_message_kwarg()
     def seek_backward(self, seconds=1, source_message: Optional[Message] = None):
         """Rewind X seconds
          Args:
             seconds (int): number of seconds to rewind
             source_message: bus message that triggered this action
         """
-        if isinstance(seconds, timedelta):
-            seconds = seconds.total_seconds()
-        self.bus.emit(source_message.forward('ovos.common_play.seek',
-                                             {"seconds": seconds * -1}))
+        source_message = _resolve_source_message(source_message)
+        seconds = _to_seconds(seconds)
+        self._seeks.add(seconds * -1, source_message)
 
-    @_ensure_message_kwarg()
     def get_track_length(self, source_message: Optional[Message] = None):
         """
         getting the duration of the audio in miliseconds
          Args:
             source_message: bus message that triggered this action
         """
+        source_message = _resolve_source_message(source_message)
         length = 0
         msg = source_message.forward('ovos.common_play.get_track_length')
         info = self.bus.wait_for_response(msg, timeout=1)
@@ -467,13 +634,13 @@ class OCPInterface:
             length = info.data.get("length", 0)
         return length
 
-    @_ensure_message_kwarg()
     def get_track_position(self, source_message: Optional[Message] = None):
         """
         get current position in miliseconds
          Args:
             source_message: bus message that triggered this action
         """
+        source_message = _resolve_source_message(source_message)
         pos = 0
         msg = source_message.forward('ovos.common_play.get_track_position')
         info = self.bus.wait_for_response(msg, timeout=1)
@@ -481,17 +648,39 @@ class OCPInterface:
             pos = info.data.get("position", 0)
         return pos
 
-    @_ensure_message_kwarg()
+    def get_track_status(self, source_message: Optional[Message] = None) -> Tuple[int, int]:
+        """
+        get track length and current position in miliseconds, both are
+        requested at once so this takes a single round-trip
+         Args:
+            source_message: bus message that triggered this action
+        Returns:
+            (length, position) tuple
+        """
+        source_message = _resolve_source_message(source_message)
+        length_msg = source_message.forward('ovos.common_play.get_track_length')
+        position_msg = source_message.forward('ovos.common_play.get_track_position')
+        length_waiter = MessageWaiter(self.bus, length_msg.msg_type + '.response')
+        position_waiter = MessageWaiter(self.bus, position_msg.msg_type + '.response')
+        self.bus.emit(length_msg)
+        self.bus.emit(position_msg)
+        deadline = time.monotonic() + 1
+        length = length_waiter.wait(1)
+        position = position_waiter.wait(max(0.0, deadline - time.monotonic()))
+        return (length.data.get("length", 0) if length else 0,
+                position.data.get("position", 0) if position else 0)
+
     def set_track_position(self, miliseconds, source_message: Optional[Message] = None):
         """Go to X position.
         Arguments:
             miliseconds (int): position to go to in miliseconds
             source_message: bus message that triggered this action
         """
+        source_message = _resolve_source_message(source_message)
+        self._seeks.discard()
         self.bus.emit(source_message.forward('ovos.common_play.set_track_position',
                                              {"position": miliseconds}))
 
-    @_ensure_message_kwarg()
     def track_info(self, source_message: Optional[Message] = None):
         """Request information of current playing track.
          Args:
@@ -499,11 +688,11 @@ class OCPInterface:
         Returns:
             Dict with track info.
         """
+        source_message = _resolve_source_message(source_message)
         msg = source_message.forward('ovos.common_play.track_info')
         response = self.bus.wait_for_response(msg)
         return response.data if response else {}
 
-    @_ensure_message_kwarg()
     def available_backends(self, source_message: Optional[Message] = None):
         """Return available audio backends.
          Args:
@@ -511,15 +700,16 @@ class OCPInterface:
         Returns:
             dict with backend names as keys
         """
+        source_message = _resolve_source_message(source_message)
         msg = source_message.forward('ovos.common_play.list_backends')
         response = self.bus.wait_for_response(msg)
         return response.data if response else {}
 
 
 class OCPQuery:
-    try:
-        from ovos_utils.ocp import MediaType
-        cast2audio = [
+    MediaType = MediaType
+    if _OCP_AVAILABLE:
+        cast2audio = frozenset([
             MediaType.MUSIC,
             MediaType.PODCAST,
             MediaType.AUDIOBOOK,
@@ -527,99 +717,124 @@ class OCPQuery:
             MediaType.RADIO_THEATRE,
             MediaType.VISUAL_STORY,
             MediaType.NEWS
-        ]
-    except ImportError as e:
-        from enum import IntEnum
-
-        class MediaType(IntEnum):
-            GENERIC = 0  # nothing else matches
-
+        ])
+    else:
         cast2audio = None
 
+    start_grace = 0.5  # seconds for all skills to acknowledge a search
+
     def __init__(self, query, bus, media_type=MediaType.GENERIC, config=None):
-        if self.cast2audio is None:
+        if not _OCP_AVAILABLE:
             raise RuntimeError("This class requires ovos-utils ~=0.1")
         LOG.debug(f"Created {media_type.name} query: {query}")
         self.query = query
+        self.query_id = uuid4().hex
         self.media_type = media_type
         self.bus = bus
         self.config = config or {}
+        self._events_registered = False
         self.reset()
 
     def reset(self):
-        try:
-            from ovos_utils.ocp import PlaybackMode
-        except ImportError as e:
-            raise RuntimeError("This method requires ovos-utils ~=0.1") from e
-        self.active_skills = {}
+        _require_ocp()
+        self.active_skills = set()  # skill_ids still searching
         self.active_skills_lock = Lock()
         self.query_replies = []
         self.searching = False
+        self._done = Event()  # set when searching stops
+        self._stop_timer = None  # early stop grace period
+        self._idle_timer = None  # "all skills done" re-check after start_grace
         self.search_start = 0
         self.query_timeouts = self.config.get("min_timeout", 5)
-        if self.config.get("playback_mode") in [PlaybackMode.AUDIO_ONLY]:
+        # read once per query, used for every skill response
+        self._allow_ext = self.config.get("allow_extensions", True)
+        self._early_stop = self.config.get("early_stop_thresh", 85)
+        self._grace = self.config.get("early_stop_grace_period", 0.5)
+        self.start_grace = self.config.get("search_start_grace",
+                                           type(self).start_grace)
+        if self.config.get("playback_mode") == PlaybackMode.AUDIO_ONLY:
             self.has_gui = False
         else:
-            self.has_gui = is_gui_running() or is_gui_connected(self.bus)
+            self.has_gui = _has_gui(self.bus)
 
-    @_ensure_message_kwarg()
     def send(self, skill_id: str = None, source_message: Optional[Message] = None):
+        source_message = _resolve_source_message(source_message)
         self.query_replies = []
         self.query_timeouts = self.config.get("min_timeout", 5)
-        self.search_start = time.time()
+        # monotonic, elapsed time checks must not follow wall clock jumps
+        self.search_start = time.monotonic()
         self.searching = True
+        self._done.clear()
+        self._cancel_timers()
         self.register_events()
         if skill_id:
             self.bus.emit(source_message.forward(f'ovos.common_play.query.{skill_id}',
                                                  {"phrase": self.query,
+                                                  "query_id": self.query_id,
                                                   "question_type": self.media_type}))
         else:
             self.bus.emit(source_message.forward('ovos.common_play.query',
                                                  {"phrase": self.query,
+                                                  "query_id": self.query_id,
                                                   "question_type": self.media_type}))
 
     def wait(self):
-        try:
-            from ovos_utils.ocp import MediaType
-        except ImportError as e:
-            raise RuntimeError("This method requires ovos-utils ~=0.1") from e
+        _require_ocp()
         # if there is no match type defined, lets increase timeout a bit
         # since all skills need to search
         if self.media_type == MediaType.GENERIC:
             timeout = self.config.get("max_timeout", 15) + 3  # timeout bonus
         else:
             timeout = self.config.get("max_timeout", 15)
-        while self.searching and time.time() - self.search_start <= timeout:
-            time.sleep(0.1)
+        remaining = timeout - (time.monotonic() - self.search_start)
+        if self.searching and remaining > 0:
+            self._done.wait(remaining)
         self.searching = False
+        self._done.set()
+        self._cancel_timers()
         self.remove_events()
 
     @property
     def results(self) -> List[dict]:
-        return [s for s in self.query_replies if s.get("results")]
+        # handle_skill_response only stores replies that have results,
+        # a copy so callers can sort/filter it without touching the query
+        return list(self.query_replies)
 
     def register_events(self):
+        if self._events_registered:
+            return  # handlers stay registered across consecutive sends
+        self._events_registered = True
         LOG.debug("Registering Search Bus Events")
         self.bus.on("ovos.common_play.skill.search_start", self.handle_skill_search_start)
         self.bus.on("ovos.common_play.skill.search_end", self.handle_skill_search_end)
         self.bus.on("ovos.common_play.query.response", self.handle_skill_response)
 
     def remove_events(self):
+        if not self._events_registered:
+            return
+        self._events_registered = False
         LOG.debug("Removing Search Bus Events")
-        self.bus.remove_all_listeners("ovos.common_play.skill.search_start")
-        self.bus.remove_all_listeners("ovos.common_play.skill.search_end")
-        self.bus.remove_all_listeners("ovos.common_play.query.response")
+        # only this query's handlers, other queries may be running
+        self.bus.remove("ovos.common_play.skill.search_start", self.handle_skill_search_start)
+        self.bus.remove("ovos.common_play.skill.search_end", self.handle_skill_search_end)
+        self.bus.remove("ovos.common_play.query.response", self.handle_skill_response)
+
+    def _is_other_query(self, message) -> bool:
+        # skills that do not echo the query_id are matched by phrase only
+        query_id = message.data.get("query_id")
+        return query_id is not None and query_id != self.query_id
 
     def handle_skill_search_start(self, message):
+        if self._is_other_query(message):
+            return
         skill_id = message.data["skill_id"]
         LOG.debug(f"{message.data['skill_id']} is searching")
         with self.active_skills_lock:
-            if skill_id not in self.active_skills:
-                self.active_skills[skill_id] = Lock()
+            self.active_skills.add(skill_id)
 
     def handle_skill_response(self, message):
         search_phrase = message.data["phrase"]
-        if search_phrase != self.query:
+        if search_phrase != self.query or self._is_other_query(message):
             # not an answer for this search query
             return
         timeout = message.data.get("timeout")
@@ -628,87 +843,174 @@ class OCPQuery:
 
         # in case this handler fires before the search start handler
         with self.active_skills_lock:
-            if skill_id not in self.active_skills:
-                self.active_skills[skill_id] = Lock()
-        with self.active_skills[skill_id]:
-            if message.data.get("searching"):
-                # extend the timeout by N seconds
-                if timeout and self.config.get("allow_extensions", True):
-                    self.query_timeouts += timeout
-                # else -> expired search
+            self.active_skills.add(skill_id)
+        if message.data.get("searching"):
+            # extend the timeout by N seconds
+            if timeout and self._allow_ext:
+                self.query_timeouts += timeout
+            # else -> expired search
 
-            else:
-                # Collect replies until the timeout
-                if not self.searching and not len(self.query_replies):
-                    LOG.debug("  too late!! ignored in track selection process")
-                    LOG.warning(f"{skill_id} is not answering fast enough!")
-                    return
-
-                # populate search playlist
-                res = message.data.get("results", [])
-                LOG.debug(f'got {len(res)} results from {skill_id}')
-                if res:
-                    self.query_replies.append(message.data)
-
-                    # abort searching if we gathered enough results
-                    # TODO ensure we have a decent confidence match, if all matches
-                    #  are < 50% conf extend timeout instead
-                    if time.time() - self.search_start > self.query_timeouts:
-                        if self.searching:
-                            self.searching = False
-                            LOG.debug("common play query timeout, parsing results")
-
-                    elif self.searching:
-                        for res in message.data.get("results", []):
-                            if res.get("match_confidence", 0) >= \
-                                    self.config.get("early_stop_thresh", 85):
-                                # got a really good match, dont search further
-                                LOG.info(
-                                    "Receiving very high confidence match, stopping "
-                                    "search early")
-
-                                # allow other skills to "just miss"
-                                early_stop_grace = \
-                                    self.config.get("early_stop_grace_period", 0.5)
-                                if early_stop_grace:
-                                    LOG.debug(
-                                        f"  - grace period: {early_stop_grace} seconds")
-                                    time.sleep(early_stop_grace)
-                                self.searching = False
-                                return
+        else:
+            # Collect replies until the timeout
+            if not self.searching and not len(self.query_replies):
+                LOG.debug("  too late!! ignored in track selection process")
+                LOG.warning(f"{skill_id} is not answering fast enough!")
+                return
+
+            # populate search playlist
+            res = message.data.get("results", [])
+            LOG.debug(f'got {len(res)} results from {skill_id}')
+            if res:
+                self.query_replies.append(message.data)
+
+                # abort searching if we gathered enough results
+                # TODO ensure we have a decent confidence match, if all matches
+                #  are < 50% conf extend timeout instead
+                if time.monotonic() - self.search_start > self.query_timeouts:
+                    if self.searching:
+                        self.searching = False
+                        self._done.set()
+                        LOG.debug("common play query timeout, parsing results")
+
+                elif self.searching:
+                    for res in message.data.get("results", []):
+                        if res.get("match_confidence", 0) >= self._early_stop:
+                            # got a really good match, dont search further
+                            LOG.info(
+                                "Receiving very high confidence match, stopping "
+                                "search early")
+
+                            # allow other skills to "just miss", replies
+                            # keep being collected until the timer fires
+                            early_stop_grace = self._grace
+                            if not early_stop_grace:
+                                self._finalize()
+                            elif self._stop_timer is None:
+                                LOG.debug(
+                                    f"  - grace period: {early_stop_grace} seconds")
+                                self._stop_timer = Timer(early_stop_grace,
+                                                         self._finalize)
+                                self._stop_timer.daemon = True
+                                self._stop_timer.start()
+                            return
 
     def handle_skill_search_end(self, message):
+        if self._is_other_query(message):
+            return
         skill_id = message.data["skill_id"]
         LOG.debug(f"{message.data['skill_id']} finished search")
         with self.active_skills_lock:
-            if skill_id in self.active_skills:
-                with self.active_skills[skill_id]:
-                    del self.active_skills[skill_id]
+            self.active_skills.discard(skill_id)
 
         # if this was the last skill end searching period
-        time.sleep(0.5)
-        # TODO this sleep is hacky, but avoids a race condition in
-        # case some skill just decides to respond before the others even
-        # acknowledge search is starting, this gives more than enough time
-        # for self.active_skills to be populated, a better approach should
-        # be employed but this works fine for now
+        # skills that answer before the others even acknowledge the search
+        # would end it too soon, so "all skills done" only counts once the
+        # search has been running for a short while; re-check then instead
+        # of blocking the bus thread
+        remaining = self.search_start + self.start_grace - time.monotonic()
+        if remaining > 0:
+            # a single pending re-check per query covers every skill
+            with self.active_skills_lock:
+                if self._idle_timer is None:
+                    self._idle_timer = Timer(remaining, self._idle_check)
+                    self._idle_timer.daemon = True
+                    self._idle_timer.start()
+        else:
+            self._end_if_idle()
+
+    def _idle_check(self):
+        with self.active_skills_lock:
+            self._idle_timer = None
+        self._end_if_idle()
+
+    def _end_if_idle(self):
         if not self.active_skills and self.searching:
             LOG.info("Received search responses from all skills!")
-            self.searching = False
+            self._finalize()
+
+    def _finalize(self):
+        self.searching = False
+        self._done.set()
+
+    def _cancel_timers(self):
+        if self._stop_timer is not None:
+            self._stop_timer.cancel()
+            self._stop_timer = None
+        with self.active_skills_lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
 
 
 ##########################################################
 # WIP ZONE - APIs below used for ovos-media
 
 
-class OCPAudioServiceInterface:
-    """Internal OCP audio subsystem
-    most likely you should use OCPInterface instead
+class _MediaServiceBase:
+    """shared ovos-media service api, subclasses set the bus namespace
     NOTE: this class operates with uris not with MediaEntry/Playlist/dict entries
-    """
 
-    def __init__(self, bus=None):
+    the first track_info() / is_playing call registers a bus handler for
+    the replies, call shutdown() once the interface is no longer needed
+
+    Args:
+        bus: OpenVoiceOS messagebus connection
+        seek_window: seconds to merge consecutive relative seeks for,
+            0 sends every seek right away
+    """
+    namespace = ""  # "audio", "video" or "web"
+    # "__dict__" is kept so subclasses can still add their own attributes
+    __slots__ = ("bus", "_seeks", "_msg_play", "_msg_stop", "_msg_next",
+                 "_msg_prev", "_msg_pause", "_msg_resume", "_msg_get_length",
+                 "_msg_get_position", "_msg_set_position",
+                 "_msg_seek_forward", "_msg_seek_backward", "_msg_track_info",
+                 "_msg_track_info_reply", "_msg_list_backends",
+                 "_track_info", "_track_info_event", "_track_info_lock",
+                 "_track_info_id", "_track_info_registered",
+                 "__dict__", "__weakref__")
+
+    def __init__(self, bus=None, seek_window: float = 0.0):
         self.bus = bus or get_mycroft_bus()
+        self._seeks = _SeekCoalescer(self._emit_seek, seek_window)
+        # interned, in process bus dispatch compares them by identity first
+        prefix = f"ovos.{self.namespace}.service."
+        self._msg_play = sys.intern(prefix + "play")
+        self._msg_stop = sys.intern(prefix + "stop")
+        self._msg_next = sys.intern(prefix + "next")
+        self._msg_prev = sys.intern(prefix + "prev")
+        self._msg_pause = sys.intern(prefix + "pause")
+        self._msg_resume = sys.intern(prefix + "resume")
+        self._msg_get_length = sys.intern(prefix + "get_track_length")
+        self._msg_get_position = sys.intern(prefix + "get_track_position")
+        self._msg_set_position = sys.intern(prefix + "set_track_position")
+        self._msg_seek_forward = sys.intern(prefix + "seek_forward")
+        self._msg_seek_backward = sys.intern(prefix + "seek_backward")
+        self._msg_track_info = sys.intern(prefix + "track_info")
+        self._msg_track_info_reply = sys.intern(self._msg_track_info + "_reply")
+        self._msg_list_backends = sys.intern(prefix + "list_backends")
+        # one reply handler, registered on first use, instead of a waiter
+        # per request
+        self._track_info = {}
+        self._track_info_event = Event()
+        self._track_info_lock = Lock()
+        self._track_info_id = None  # id of the request being waited on
+        self._track_info_registered = False
+
+    def _on_track_info(self, message):
+        request_id = self._track_info_id
+        if request_id is None or \
+                message.context.get("track_info_id", request_id) != request_id:
+            return  # late reply to a timed out request, or not ours
+        self._track_info = message.data
+        self._track_info_event.set()
+
+    def _emit_seek(self, seconds: float, source_message: Optional[Message] = None):
+        if seconds < 0:
+            self.bus.emit(Message(self._msg_seek_backward,
+                                  {"seconds": abs(seconds)}))
+        else:
+            self.bus.emit(Message(self._msg_seek_forward,
+                                  {"seconds": seconds}))
 
     def play(self, tracks=None, utterance=None, repeat=None):
         """Start playback.
@@ -722,46 +1024,40 @@ class OCPAudioServiceInterface:
             repeat: if the playback should be looped
         """
         repeat = repeat or False
-        tracks = tracks or []
         utterance = utterance or ''
-        if isinstance(tracks, (str, tuple)):
-            tracks = [tracks]
-        elif not isinstance(tracks, list):
-            raise ValueError
-        tracks = [ensure_uri(t) for t in tracks]
-        self.bus.emit(Message('ovos.audio.service.play',
+        tracks = _normalize_tracks(tracks)
+        self.bus.emit(Message(self._msg_play,
                               data={'tracks': tracks,
                                     'utterance': utterance,
                                     'repeat': repeat}))
 
     def stop(self):
         """Stop the track."""
-        self.bus.emit(Message('ovos.audio.service.stop'))
+        self.bus.emit(Message(self._msg_stop))
 
     def next(self):
         """Change to next track."""
-        self.bus.emit(Message('ovos.audio.service.next'))
+        self.bus.emit(Message(self._msg_next))
 
     def prev(self):
         """Change to previous track."""
-        self.bus.emit(Message('ovos.audio.service.prev'))
+        self.bus.emit(Message(self._msg_prev))
 
     def pause(self):
         """Pause playback."""
-        self.bus.emit(Message('ovos.audio.service.pause'))
+        self.bus.emit(Message(self._msg_pause))
 
     def resume(self):
         """Resume paused playback."""
-        self.bus.emit(Message('ovos.audio.service.resume'))
+        self.bus.emit(Message(self._msg_resume))
 
     def get_track_length(self):
         """
         getting the duration of the audio in seconds
         """
         length = 0
-        info = self.bus.wait_for_response(
-            Message('ovos.audio.service.get_track_length'),
-            timeout=1)
+        info = self.bus.wait_for_response(Message(self._msg_get_length),
+                                          timeout=1)
         if info:
             length = info.data.get("length") or 0
         return length / 1000  # convert to seconds
@@ -771,9 +1067,8 @@ class OCPAudioServiceInterface:
         get current position in seconds
         """
         pos = 0
-        info = self.bus.wait_for_response(
-            Message('ovos.audio.service.get_track_position'),
-            timeout=1)
+        info = self.bus.wait_for_response(Message(self._msg_get_position),
+                                          timeout=1)
         if info:
             pos = info.data.get("position") or 0
         return pos / 1000  # convert to seconds
@@ -784,8 +1079,14 @@ class OCPAudioServiceInterface:
         Arguments:
             seconds (int): number of seconds to seek, if negative rewind
         """
-        self.bus.emit(Message('ovos.audio.service.set_track_position',
-                              {"position": seconds * 1000}))  # convert to ms
+        self._seeks.discard()
+        self.bus.emit(Message(self._msg_set_position,
+                              {"position": round(seconds * 1000)}))  # convert to ms
+
+    def flush_seek(self):
+        """send any seek still being merged by seek_window right away,
+        e.g. when the user releases a scrubber"""
+        self._seeks.flush()
 
     def seek(self, seconds: Union[int, float, timedelta] = 1):
         """Seek X seconds.
@@ -793,12 +1094,8 @@ class OCPAudioServiceInterface:
         Args:
             seconds (int): number of seconds to seek, if negative rewind
         """
-        if isinstance(seconds, timedelta):
-            seconds = seconds.total_seconds()
-        if seconds < 0:
-            self.seek_backward(abs(seconds))
-        else:
-            self.seek_forward(seconds)
+        # normalized once, the coalescer picks forward/backward by sign
+        self._seeks.add(_to_seconds(seconds), None)
 
     def seek_forward(self, seconds: Union[int, float, timedelta] = 1):
         """Skip ahead X seconds.
@@ -806,10 +1103,8 @@ class OCPAudioServiceInterface:
         Args:
             seconds (int): number of seconds to skip
         """
-        if isinstance(seconds, timedelta):
-            seconds = seconds.total_seconds()
-        self.bus.emit(Message('ovos.audio.service.seek_forward',
-                              {"seconds": seconds}))
+        seconds = _to_seconds(seconds)
+        self._seeks.add(seconds, None)
 
     def seek_backward(self, seconds: Union[int, float, timedelta] = 1):
         """Rewind X seconds
@@ -817,10 +1112,8 @@ class OCPAudioServiceInterface:
          Args:
             seconds (int): number of seconds to rewind
         """
-        if isinstance(seconds, timedelta):
-            seconds = seconds.total_seconds()
-        self.bus.emit(Message('ovos.audio.service.seek_backward',
-                              {"seconds": seconds}))
+        seconds = _to_seconds(seconds)
+        self._seeks.add(-seconds, None)
 
     def track_info(self):
         """Request information of current playing track.
@@ -828,321 +1121,67 @@ class OCPAudioServiceInterface:
         Returns:
             Dict with track info.
         """
-        info = self.bus.wait_for_response(
-            Message('ovos.audio.service.track_info'),
-            reply_type='ovos.audio.service.track_info_reply',
-            timeout=1)
-        return info.data if info else {}
+        with self._track_info_lock:
+            if not self._track_info_registered:
+                self.bus.on(self._msg_track_info_reply, self._on_track_info)
+                self._track_info_registered = True
+            self._track_info_id = uuid4().hex
+            self._track_info_event.clear()
+            try:
+                self.bus.emit(Message(self._msg_track_info,
+                                      context={"track_info_id": self._track_info_id}))
+                if not self._track_info_event.wait(1):
+                    return {}
+                return self._track_info
+            finally:
+                self._track_info_id = None
 
     def available_backends(self):
-        """Return available audio backends.
+        """Return available backends.
 
         Returns:
             dict with backend names as keys
         """
-        msg = Message('ovos.audio.service.list_backends')
+        msg = Message(self._msg_list_backends)
         response = self.bus.wait_for_response(msg)
         return response.data if response else {}
 
     @property
     def is_playing(self):
-        """True if the audioservice is playing, else False."""
+        """True if the service is playing, else False."""
         return self.track_info() != {}
 
+    def shutdown(self):
+        """remove the bus handlers registered by this interface"""
+        self._seeks.discard()
+        with self._track_info_lock:
+            if self._track_info_registered:
+                self.bus.remove(self._msg_track_info_reply, self._on_track_info)
+                self._track_info_registered = False
 
-class OCPVideoServiceInterface:
-    """Internal OCP video subsystem
+
+class OCPAudioServiceInterface(_MediaServiceBase):
+    """Internal OCP audio subsystem
     most likely you should use OCPInterface instead
     NOTE: this class operates with uris not with MediaEntry/Playlist/dict entries
     """
+    namespace = "audio"
+    __slots__ = ()
 
-    def __init__(self, bus=None):
-        self.bus = bus or get_mycroft_bus()
-
-    def play(self, tracks=None, utterance=None, repeat=None):
-        """Start playback.
-
-        Args:
-            tracks: track uri or list of track uri's
-                    Each track can be added as a tuple with (uri, mime)
-                    to give a hint of the mime type to the system
-            utterance: forward utterance for further processing by the
-                        video service.
-            repeat: if the playback should be looped
-        """
-        repeat = repeat or False
-        tracks = tracks or []
-        utterance = utterance or ''
-        if isinstance(tracks, (str, tuple)):
-            tracks = [tracks]
-        elif not isinstance(tracks, list):
-            raise ValueError
-        tracks = [ensure_uri(t) for t in tracks]
-        self.bus.emit(Message('ovos.video.service.play',
-                              data={'tracks': tracks,
-                                    'utterance': utterance,
-                                    'repeat': repeat}))
-
-    def stop(self):
-        """Stop the track."""
-        self.bus.emit(Message('ovos.video.service.stop'))
-
-    def next(self):
-        """Change to next track."""
-        self.bus.emit(Message('ovos.video.service.next'))
-
-    def prev(self):
-        """Change to previous track."""
-        self.bus.emit(Message('ovos.video.service.prev'))
-
-    def pause(self):
-        """Pause playback."""
-        self.bus.emit(Message('ovos.video.service.pause'))
-
-    def resume(self):
-        """Resume paused playback."""
-        self.bus.emit(Message('ovos.video.service.resume'))
-
-    def get_track_length(self):
-        """
-        getting the duration of the video in seconds
-        """
-        length = 0
-        info = self.bus.wait_for_response(
-            Message('ovos.video.service.get_track_length'),
-            timeout=1)
-        if info:
-            length = info.data.get("length") or 0
-        return length / 1000  # convert to seconds
-
-    def get_track_position(self):
-        """
-        get current position in seconds
-        """
-        pos = 0
-        info = self.bus.wait_for_response(
-            Message('ovos.video.service.get_track_position'),
-            timeout=1)
-        if info:
-            pos = info.data.get("position") or 0
-        return pos / 1000  # convert to seconds
-
-    def set_track_position(self, seconds):
-        """Seek X seconds.
 
-        Arguments:
-            seconds (int): number of seconds to seek, if negative rewind
-        """
-        self.bus.emit(Message('ovos.video.service.set_track_position',
-                              {"position": seconds * 1000}))  # convert to ms
-
-    def seek(self, seconds=1):
-        """Seek X seconds.
-
-        Args:
-            seconds (int): number of seconds to seek, if negative rewind
-        """
-        if isinstance(seconds, timedelta):
-            seconds = seconds.total_seconds()
-        if seconds < 0:
-            self.seek_backward(abs(seconds))
-        else:
-            self.seek_forward(seconds)
-
-    def seek_forward(self, seconds: Union[int, float, timedelta] = 1):
-        """Skip ahead X seconds.
-
-        Args:
-            seconds (int): number of seconds to skip
-        """
-        if isinstance(seconds, timedelta):
-            seconds = seconds.total_seconds()
-        self.bus.emit(Message('ovos.video.service.seek_forward',
-                              {"seconds": seconds}))
-
-    def seek_backward(self, seconds: Union[int, float, timedelta] = 1):
-        """Rewind X seconds
-
-         Args:
-            seconds (int): number of seconds to rewind
-        """
-        if isinstance(seconds, timedelta):
-            seconds = seconds.total_seconds()
-        self.bus.emit(Message('ovos.video.service.seek_backward',
-                              {"seconds": seconds}))
-
-    def track_info(self):
-        """Request information of current playing track.
-
-        Returns:
-            Dict with track info.
-        """
-        info = self.bus.wait_for_response(
-            Message('ovos.video.service.track_info'),
-            reply_type='ovos.video.service.track_info_reply',
-            timeout=1)
-        return info.data if info else {}
-
-    def available_backends(self):
-        """Return available video backends.
-
-        Returns:
-            dict with backend names as keys
-        """
-        msg = Message('ovos.video.service.list_backends')
-        response = self.bus.wait_for_response(msg)
-        return response.data if response else {}
-
-    @property
-    def is_playing(self):
-        """True if the videoservice is playing, else False."""
-        return self.track_info() != {}
+class OCPVideoServiceInterface(_MediaServiceBase):
+    """Internal OCP video subsystem
+    most likely you should use OCPInterface instead
+    NOTE: this class operates with uris not with MediaEntry/Playlist/dict entries
+    """
+    namespace = "video"
+    __slots__ = ()
 
 
-class OCPWebServiceInterface:
+class OCPWebServiceInterface(_MediaServiceBase):
     """Internal OCP web view subsystem
     most likely you should use OCPInterface instead
     NOTE: this class operates with uris not with MediaEntry/Playlist/dict entries
     """
-
-    def __init__(self, bus=None):
-        self.bus = bus or get_mycroft_bus()
-
-    def play(self, tracks=None, utterance=None, repeat=None):
-        """Start playback.
-
-        Args:
-            tracks: track uri or list of track uri's
-                    Each track can be added as a tuple with (uri, mime)
-                    to give a hint of the mime type to the system
-            utterance: forward utterance for further processing by the
-                        web service.
-            repeat: if the playback should be looped
-        """
-        repeat = repeat or False
-        tracks = tracks or []
-        utterance = utterance or ''
-        if isinstance(tracks, (str, tuple)):
-            tracks = [tracks]
-        elif not isinstance(tracks, list):
-            raise ValueError
-        tracks = [ensure_uri(t) for t in tracks]
-        self.bus.emit(Message('ovos.web.service.play',
-                              data={'tracks': tracks,
-                                    'utterance': utterance,
-                                    'repeat': repeat}))
-
-    def stop(self):
-        """Stop the track."""
-        self.bus.emit(Message('ovos.web.service.stop'))
-
-    def next(self):
-        """Change to next track."""
-        self.bus.emit(Message('ovos.web.service.next'))
-
-    def prev(self):
-        """Change to previous track."""
-        self.bus.emit(Message('ovos.web.service.prev'))
-
-    def pause(self):
-        """Pause playback."""
-        self.bus.emit(Message('ovos.web.service.pause'))
-
-    def resume(self):
-        """Resume paused playback."""
-        self.bus.emit(Message('ovos.web.service.resume'))
-
-    def get_track_length(self):
-        """
-        getting the duration of the web in seconds
-        """
-        length = 0
-        info = self.bus.wait_for_response(
-            Message('ovos.web.service.get_track_length'),
-            timeout=1)
-        if info:
-            length = info.data.get("length") or 0
-        return length / 1000  # convert to seconds
-
-    def get_track_position(self):
-        """
-        get current position in seconds
-        """
-        pos = 0
-        info = self.bus.wait_for_response(
-            Message('ovos.web.service.get_track_position'),
-            timeout=1)
-        if info:
-            pos = info.data.get("position") or 0
-        return pos / 1000  # convert to seconds
-
-    def set_track_position(self, seconds):
-        """Seek X seconds.
-
-        Arguments:
-            seconds (int): number of seconds to seek, if negative rewind
-        """
-        self.bus.emit(Message('ovos.web.service.set_track_position',
-                              {"position": seconds * 1000}))  # convert to ms
-
-    def seek(self, seconds: Union[int, float, timedelta] = 1):
-        """Seek X seconds.
-
-        Args:
-            seconds (int): number of seconds to seek, if negative rewind
-        """
-        if isinstance(seconds, timedelta):
-            seconds = seconds.total_seconds()
-        if seconds < 0:
-            self.seek_backward(abs(seconds))
-        else:
-            self.seek_forward(seconds)
-
-    def seek_forward(self, seconds: Union[int, float, timedelta] = 1):
-        """Skip ahead X seconds.
-
-        Args:
-            seconds (int): number of seconds to skip
-        """
-        if isinstance(seconds, timedelta):
-            seconds = seconds.total_seconds()
-        self.bus.emit(Message('ovos.web.service.seek_forward',
-                              {"seconds": seconds}))
-
-    def seek_backward(self, seconds: Union[int, float, timedelta] = 1):
-        """Rewind X seconds
-
-         Args:
-            seconds (int): number of seconds to rewind
-        """
-        if isinstance(seconds, timedelta):
-            seconds = seconds.total_seconds()
-        self.bus.emit(Message('ovos.web.service.seek_backward',
-                              {"seconds": seconds}))
-
-    def track_info(self):
-        """Request information of current playing track.
-
-        Returns:
-            Dict with track info.
-        """
-        info = self.bus.wait_for_response(
-            Message('ovos.web.service.track_info'),
-            reply_type='ovos.web.service.track_info_reply',
-            timeout=1)
-        return info.data if info else {}
-
-    def available_backends(self):
-        """Return available web backends.
-
-        Returns:
-            dict with backend names as keys
-        """
-        msg = Message('ovos.web.service.list_backends')
-        response = self.bus.wait_for_response(msg)
-        return response.data if response else {}
-
-    @property
-    def is_playing(self):
-        """True if the webservice is playing, else False."""
-        return self.track_info() != {}
+    namespace = "web"
+    __slots__ = ()
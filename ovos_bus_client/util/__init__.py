@@ -15,6 +15,8 @@
 """
 Tools and constructs that are useful together with the messagebus.
 """
+import binascii
+
 import orjson
 
 from ovos_config.config import read_mycroft_config
@@ -157,38 +159,62 @@ def send_message(message, data=None, context=None, bus=None):
         bus.close()
 
 
+def _encode_binary(binary_data, encoding="hex") -> str:
+    if encoding == "base64":
+        return binascii.b2a_base64(binary_data, newline=False).decode("ascii")
+    if encoding == "hex":
+        return binary_data.hex()
+    raise ValueError(f"unsupported binary encoding: {encoding}")
+
+
 def send_binary_data_message(binary_data, msg_type="mycroft.binary.data",
-                             msg_data=None, msg_context=None, bus=None):
+                             msg_data=None, msg_context=None, bus=None,
+                             encoding="hex"):
+    """
+    Emit binary data as a string in message.data["binary"]
+    @param encoding: "hex" (default) or "base64", base64 payloads are 1/3
+        smaller but need a receiver that checks message.data["encoding"]
+    """
     msg_data = msg_data or {}
     msg = {
         "type": msg_type,
-        "data": merge_dict(msg_data, {"binary": binary_data.hex()}),
+        "data": merge_dict(msg_data, {"binary": _encode_binary(binary_data, encoding),
+                                      "encoding": encoding}),
         "context": msg_context or None
     }
     send_message(msg, bus=bus)
 
 
 def send_binary_file_message(filepath, msg_type="mycroft.binary.file",
-                             msg_context=None, bus=None):
+                             msg_context=None, bus=None, encoding="hex"):
     with open(filepath, 'rb') as f:
         binary_data = f.read()
     msg_data = {"path": filepath}
     send_binary_data_message(binary_data, msg_type=msg_type, msg_data=msg_data,
-                             msg_context=msg_context, bus=bus)
+                             msg_context=msg_context, bus=bus,
+                             encoding=encoding)
 
 
 def decode_binary_message(message):
+    encoding = "hex"
     if isinstance(message, str):
         try:  # json string
             message = orjson.loads(message)
-            binary_data = message.get("binary") or message["data"]["binary"]
+            data = message if "binary" in message else message["data"]
+            binary_data = data["binary"]
+            encoding = data.get("encoding") or encoding
         except:  # hex string
             binary_data = message
     elif isinstance(message, dict):
         # data field or serialized message
-        binary_data = message.get("binary") or message["data"]["binary"]
+        data = message if "binary" in message else message["data"]
+        binary_data = data["binary"]
+        encoding = data.get("encoding") or encoding
     else:
         # message object
         binary_data = message.data["binary"]
+        encoding = message.data.get("encoding") or encoding
+    if encoding == "base64":
+        return bytearray(binascii.a2b_base64(binary_data))
     # decode hex string
     return bytearray.fromhex(binary_data)
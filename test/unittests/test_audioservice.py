@@ -52,6 +52,34 @@ class TestAudioServiceControls(TestCase):
                          'mycroft.audio.service.seek_backward')
         self.assertEqual(message.data['seconds'], 5)
 
+    def test_seek_coalescing(self):
+        bus = mock.Mock(name='bus')
+        audioservice = ClassicAudioServiceInterface(bus, seek_window=10)
+        audioservice.seek_forward(5)
+        audioservice.seek_forward(5)
+        audioservice.seek_backward(2)
+        bus.emit.assert_not_called()
+        audioservice._seeks.flush()
+        self.assertEqual(bus.emit.call_count, 1)
+        message = bus.emit.call_args[0][0]
+        self.assertEqual(message.msg_type,
+                         'mycroft.audio.service.seek_forward')
+        self.assertEqual(message.data['seconds'], 8)
+
+        # an absolute position supersedes pending relative seeks
+        audioservice.seek_forward(5)
+        audioservice.set_track_position(30)
+        self.assertEqual(bus.emit.call_count, 2)
+        self.assertEqual(bus.emit.call_args[0][0].msg_type,
+                         'mycroft.audio.service.set_track_position')
+        audioservice.flush_seek()
+        self.assertEqual(bus.emit.call_count, 2)
+
+        audioservice.set_track_position(0.57)
+        position = bus.emit.call_args[0][0].data["position"]
+        self.assertEqual(position, 570)
+        self.assertIsInstance(position, int)
+
 
 class TestAudioServicePlay(TestCase):
     def setUp(self):
@@ -124,6 +152,16 @@ class TestAudioServiceQueue(TestCase):
         with self.assertRaises(ValueError):
             self.audioservice.queue(12)
 
+    def test_queue_many(self):
+        self.audioservice.queue_many([['/a.mp3', 'http://b.mp3'],
+                                      ('/c.mp3', 'audio/mp3')])
+        self.assertEqual(self.bus.emit.call_count, 1)
+        message = self.bus.emit.call_args_list[-1][0][0]
+        self.assertEqual(message.msg_type, 'mycroft.audio.service.queue')
+        self.assertEqual(message.data['tracks'],
+                         ['file:///a.mp3', 'http://b.mp3',
+                          ('file:///c.mp3', 'audio/mp3')])
+
 
 class TestAudioServiceMisc(TestCase):
     def test_lifecycle(self):
@@ -174,3 +212,282 @@ class TestAudioServiceMisc(TestCase):
         self.assertTrue(audioservice.is_playing)
         audioservice.track_info.return_value = {}
         self.assertFalse(audioservice.is_playing)
+
+
+class TestOCPQuery(TestCase):
+    def setUp(self):
+        from ovos_utils.messagebus import FakeBus
+        from ovos_utils.ocp import MediaType, PlaybackMode
+        from ovos_bus_client.apis.ocp import OCPQuery
+        self.bus = FakeBus()
+        self.query = OCPQuery("query", self.bus, MediaType.MUSIC,
+                              config={"playback_mode": PlaybackMode.AUDIO_ONLY,
+                                      "max_timeout": 5})
+
+    def test_wait_ends_on_search_end(self):
+        import time
+        from threading import Timer
+        self.query.send(source_message=Message("test"))
+        self.bus.emit(Message("ovos.common_play.skill.search_start",
+                              {"skill_id": "skill"}))
+        Timer(0.1, self.bus.emit,
+              [Message("ovos.common_play.skill.search_end",
+                       {"skill_id": "skill"})]).start()
+        start = time.time()
+        self.query.wait()
+        self.assertLess(time.time() - start, 2)
+        self.assertFalse(self.query.searching)
+
+    def test_search_end_after_grace(self):
+        self.query.send(source_message=Message("test"))
+        self.query.start_grace = 0  # as if configured via search_start_grace
+        self.bus.emit(Message("ovos.common_play.skill.search_start",
+                              {"skill_id": "skill"}))
+        self.bus.emit(Message("ovos.common_play.skill.search_end",
+                              {"skill_id": "skill"}))
+        # no sleep in the handler, search ends right away
+        self.assertFalse(self.query.searching)
+        self.query.wait()
+
+    def test_single_idle_check(self):
+        self.query.send(source_message=Message("test"))
+        self.query.start_grace = 10
+        for skill_id in ("a", "b", "c"):
+            self.bus.emit(Message("ovos.common_play.skill.search_start",
+                                  {"skill_id": skill_id}))
+        timer = None
+        for skill_id in ("a", "b", "c"):
+            self.bus.emit(Message("ovos.common_play.skill.search_end",
+                                  {"skill_id": skill_id}))
+            timer = timer or self.query._idle_timer
+            self.assertIs(self.query._idle_timer, timer)
+        self.query.send(source_message=Message("test"))
+        self.assertIsNone(self.query._idle_timer)
+        self.assertTrue(timer.finished.is_set())  # cancelled
+        self.query.searching = False
+        self.query.wait()
+
+    def test_early_stop_grace(self):
+        import time
+        self.query.config["early_stop_grace_period"] = 0.2
+        self.query.reset()
+        self.query.send(source_message=Message("test"))
+        for conf in (90, 95):
+            self.bus.emit(Message("ovos.common_play.query.response",
+                                  {"phrase": "query", "skill_id": "skill",
+                                   "results": [{"match_confidence": conf}]}))
+        # the bus thread is not blocked, replies keep coming in
+        self.assertTrue(self.query.searching)
+        self.assertEqual(len(self.query.query_replies), 2)
+        self.query.results.clear()
+        self.assertEqual(len(self.query.results), 2)
+        start = time.time()
+        self.query.wait()
+        self.assertLess(time.time() - start, 1)
+        self.assertFalse(self.query.searching)
+
+    def test_concurrent_queries(self):
+        from ovos_utils.ocp import MediaType
+        from ovos_bus_client.apis.ocp import OCPQuery
+        other = OCPQuery("query", self.bus, MediaType.MUSIC,
+                         config=self.query.config)
+        self.query.send(source_message=Message("test"))
+        other.send(source_message=Message("test"))
+
+        def respond(query):
+            self.bus.emit(Message("ovos.common_play.query.response",
+                                  {"phrase": "query", "skill_id": "skill",
+                                   "query_id": query.query_id,
+                                   "results": [{"match_confidence": 10}]}))
+
+        respond(self.query)
+        respond(other)
+        self.assertEqual(len(self.query.results), 1)
+        self.assertEqual(len(other.results), 1)
+
+        # removing one query's handlers leaves the other one listening
+        other.remove_events()
+        respond(self.query)
+        self.assertEqual(len(self.query.results), 2)
+        self.query.remove_events()
+
+    @mock.patch("ovos_bus_client.apis.ocp.is_gui_connected")
+    @mock.patch("ovos_bus_client.apis.ocp.is_gui_running")
+    def test_gui_state_cache(self, running, connected):
+        from ovos_utils.ocp import MediaType
+        from ovos_bus_client.apis.ocp import OCPQuery
+        running.return_value = False
+        connected.return_value = True
+        bus = mock.Mock(name='bus')
+        for _ in range(3):
+            self.assertTrue(OCPQuery("query", bus, MediaType.MUSIC).has_gui)
+        connected.assert_called_once_with(bus)
+
+    @mock.patch("ovos_bus_client.apis.ocp.is_gui_connected")
+    @mock.patch("ovos_bus_client.apis.ocp.is_gui_running")
+    def test_gui_state_no_bus(self, running, connected):
+        from ovos_utils.ocp import MediaType
+        from ovos_bus_client.apis.ocp import OCPQuery
+        running.return_value = False
+        connected.return_value = False
+        # None can not be weak referenced, it is checked without caching
+        for _ in range(2):
+            self.assertFalse(OCPQuery("query", None, MediaType.MUSIC).has_gui)
+        self.assertEqual(connected.call_count, 2)
+        connected.assert_called_with(None)
+
+    def test_register_events_once(self):
+        from ovos_utils.ocp import MediaType
+        from ovos_bus_client.apis.ocp import OCPQuery
+        bus = mock.Mock(name='bus')
+        query = OCPQuery("query", bus, MediaType.MUSIC,
+                         config=self.query.config)
+        query.send(source_message=Message("test"))
+        query.send(source_message=Message("test"))
+        self.assertEqual(bus.on.call_count, 3)
+        query.remove_events()
+        query.remove_events()
+        self.assertEqual(bus.remove.call_count, 3)
+
+
+class TestOCPInterface(TestCase):
+    def test_play(self):
+        from ovos_utils.ocp import MediaEntry, Playlist
+        from ovos_bus_client.apis.ocp import OCPInterface
+        bus = mock.Mock(name='bus')
+        ocp = OCPInterface(bus)
+        tracks = [MediaEntry(uri="http://a", title="a"),
+                  MediaEntry(uri="http://b", title="b")]
+        ocp.play(tracks, source_message=Message("test"))
+        message = bus.emit.call_args[0][0]
+        self.assertEqual(message.msg_type, "ovos.common_play.play")
+        self.assertEqual(message.data["media"], tracks[0].as_dict)
+        self.assertEqual(message.data["playlist"],
+                         [t.as_dict for t in tracks])
+        self.assertEqual(message.data["disambiguation"], [])
+
+        playlists = [Playlist(tracks, title="p1"), Playlist(tracks[1:])]
+        ocp.play(playlists, source_message=Message("test"))
+        message = bus.emit.call_args[0][0]
+        self.assertEqual(message.data["media"], tracks[0].as_dict)
+        self.assertEqual(message.data["playlist"],
+                         [t.as_dict for t in tracks])
+        self.assertEqual(message.data["disambiguation"],
+                         [p.as_dict for p in playlists])
+        self.assertIsNot(message.data["playlist"],
+                         message.data["disambiguation"][0]["playlist"])
+
+        # nested playlists are kept in the playlist payload
+        nested = Playlist([tracks[0], Playlist(tracks[1:], title="inner")])
+        ocp.play([nested], source_message=Message("test"))
+        message = bus.emit.call_args[0][0]
+        self.assertEqual(message.data["playlist"],
+                         [t.as_dict for t in nested])
+
+    def test_norm_tracks(self):
+        from collections import OrderedDict
+        from ovos_utils.ocp import MediaEntry, Playlist
+        from ovos_bus_client.apis.ocp import OCPInterface
+        entry = MediaEntry(uri="http://a", title="a")
+        playlist = Playlist([entry])
+        tracks = OCPInterface.norm_tracks(
+            [entry, {"uri": "http://b", "title": "b"},
+             OrderedDict(uri="http://c", title="c"), playlist])
+        self.assertIs(tracks[0], entry)
+        self.assertIsInstance(tracks[1], MediaEntry)
+        self.assertIsInstance(tracks[2], MediaEntry)
+        self.assertIs(tracks[3], playlist)
+
+        tracks = [{"uri": "http://b", "title": "b"}]
+        self.assertIs(OCPInterface.norm_tracks(tracks), tracks)
+        self.assertIsInstance(tracks[0], MediaEntry)
+
+    def test_get_track_status(self):
+        from ovos_utils.messagebus import FakeBus
+        from ovos_bus_client.apis.ocp import OCPInterface
+        bus = FakeBus()
+        bus.on("ovos.common_play.get_track_length",
+               lambda m: bus.emit(m.response({"length": 1000})))
+        bus.on("ovos.common_play.get_track_position",
+               lambda m: bus.emit(m.response({"position": 500})))
+        ocp = OCPInterface(bus)
+        self.assertEqual(ocp.get_track_status(source_message=Message("test")),
+                         (1000, 500))
+
+
+class TestEnsureUri(TestCase):
+    def test_ensure_uris(self):
+        import os
+        from ovos_bus_client.apis.ocp import ensure_uri, ensure_uris
+        cwd = os.getcwd()
+        tracks = ["a.mp3", "/b/../c.mp3", "http://d", ("e.mp3", "audio/mp3")]
+        self.assertEqual(ensure_uris(tracks),
+                         [f"file://{cwd}/a.mp3", "file:///c.mp3", "http://d",
+                          (f"file://{cwd}/e.mp3", "audio/mp3")])
+        self.assertEqual(ensure_uris(tracks),
+                         [ensure_uri(t) for t in tracks])
+        with self.assertRaises(ValueError):
+            ensure_uri(12)
+
+
+class TestMediaServiceInterfaces(TestCase):
+    def test_namespaces(self):
+        from ovos_bus_client.apis.ocp import (OCPAudioServiceInterface,
+                                              OCPVideoServiceInterface,
+                                              OCPWebServiceInterface)
+        for cls, ns in ((OCPAudioServiceInterface, "audio"),
+                        (OCPVideoServiceInterface, "video"),
+                        (OCPWebServiceInterface, "web")):
+            bus = mock.Mock(name='bus')
+            service = cls(bus)
+            service.stop()
+            self.assertEqual(bus.emit.call_args[0][0].msg_type,
+                             f"ovos.{ns}.service.stop")
+            service.play(["http://a"])
+            message = bus.emit.call_args[0][0]
+            self.assertEqual(message.msg_type, f"ovos.{ns}.service.play")
+            self.assertEqual(message.data["tracks"], ["http://a"])
+            bus.on.assert_not_called()  # only registered on first use
+
+    def test_track_info(self):
+        from ovos_utils.messagebus import FakeBus
+        from ovos_bus_client.apis.ocp import OCPVideoServiceInterface
+        bus = FakeBus()
+        info = {"title": "video"}
+        bus.on("ovos.video.service.track_info",
+               lambda m: bus.emit(m.reply("ovos.video.service.track_info_reply",
+                                          info)))
+        service = OCPVideoServiceInterface(bus)
+        self.assertEqual(
+            len(bus.ee.listeners("ovos.video.service.track_info_reply")), 0)
+        self.assertEqual(service.track_info(), info)
+        # replies to other requests, or arriving too late, are ignored
+        late = Message("ovos.video.service.track_info_reply", {"title": "late"},
+                       {"track_info_id": "other"})
+        service._on_track_info(late)
+        self.assertEqual(service._track_info, info)
+        self.assertTrue(service.is_playing)
+        info = {}
+        self.assertFalse(service.is_playing)
+        service.shutdown()
+        self.assertEqual(
+            len(bus.ee.listeners("ovos.video.service.track_info_reply")), 0)
+
+    def test_seek_coalescing(self):
+        from ovos_bus_client.apis.ocp import OCPAudioServiceInterface
+        bus = mock.Mock(name='bus')
+        service = OCPAudioServiceInterface(bus, seek_window=10)
+        service.seek_forward(1)
+        service.seek_backward(3)
+        bus.emit.assert_not_called()
+        service.flush_seek()
+        message = bus.emit.call_args[0][0]
+        self.assertEqual(message.msg_type, "ovos.audio.service.seek_backward")
+        self.assertEqual(message.data["seconds"], 2)
+
+        from datetime import timedelta
+        service.seek(timedelta(seconds=-4))
+        service.flush_seek()
+        message = bus.emit.call_args[0][0]
+        self.assertEqual(message.msg_type, "ovos.audio.service.seek_backward")
+        self.assertEqual(message.data["seconds"], 4)
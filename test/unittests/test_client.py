@@ -206,3 +206,24 @@ class TestMessageCollector:
         collector._receive_response(valid_response)
         collector._receive_response(invalid_response)
         assert collector.collect() == [valid_response]
+
+
+class TestPackageNamespace(unittest.TestCase):
+    def test_submodule_attributes(self):
+        import subprocess
+        import sys
+        # fresh interpreter, nothing but the package itself imported
+        code = ("import ovos_bus_client as b; "
+                "[b.session, b.client, b.message, b.util, b.conf]; "
+                "assert not hasattr(b, 'no_such_module')")
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_submodule_import_error(self):
+        import ovos_bus_client
+        # a submodule with a missing dependency reads as a missing attribute
+        with patch("importlib.import_module",
+                   side_effect=ModuleNotFoundError("No module named 'dep'")):
+            with self.assertRaises(AttributeError):
+                ovos_bus_client.__getattr__("hpm")
+        with self.assertRaises(AttributeError):
+            ovos_bus_client.__getattr__("not_a_submodule")
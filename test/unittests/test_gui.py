@@ -0,0 +1,413 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from ovos_bus_client.apis.gui import GUIInterface
+
+
+class TestGUICache(unittest.TestCase):
+    def setUp(self):
+        self.src = tempfile.mkdtemp()
+        self.cache = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.src, ignore_errors=True)
+        self.addCleanup(shutil.rmtree, self.cache, ignore_errors=True)
+        os.makedirs(f"{self.src}/qt5")
+        with open(f"{self.src}/qt5/page.qml", "w") as f:
+            f.write("Item {}")
+
+    @patch("ovos_bus_client.apis.gui.get_xdg_cache_save_path")
+    def test_cache_gui_files(self, cache_path):
+        cache_path.return_value = self.cache
+        cached = f"{self.cache}/test.skill/qt5/page.qml"
+
+        GUIInterface("test.skill", config={}, cache_now=True,
+                     ui_directories={"qt5": f"{self.src}/qt5"})
+        self.assertTrue(os.path.isfile(cached))
+
+        # unchanged trees are not walked or copied again
+        with patch("shutil.copytree") as copytree:
+            GUIInterface("test.skill", config={}, cache_now=True,
+                         ui_directories={"qt5": f"{self.src}/qt5"})
+            copytree.assert_not_called()
+
+        # files removed from the skill are removed from the cache
+        with open(f"{self.src}/qt5/other.qml", "w") as f:
+            f.write("Item {}")
+        GUIInterface("test.skill", config={}, cache_now=True,
+                     ui_directories={"qt5": f"{self.src}/qt5"})
+        os.remove(f"{self.src}/qt5/other.qml")
+        GUIInterface("test.skill", config={}, cache_now=True,
+                     ui_directories={"qt5": f"{self.src}/qt5"})
+        self.assertEqual(os.listdir(f"{self.cache}/test.skill/qt5"),
+                         ["page.qml"])
+
+        # renames keep size and mtime but are picked up too
+        os.rename(f"{self.src}/qt5/page.qml", f"{self.src}/qt5/renamed.qml")
+        GUIInterface("test.skill", config={}, cache_now=True,
+                     ui_directories={"qt5": f"{self.src}/qt5"})
+        self.assertEqual(os.listdir(f"{self.cache}/test.skill/qt5"),
+                         ["renamed.qml"])
+        os.rename(f"{self.src}/qt5/renamed.qml", f"{self.src}/qt5/page.qml")
+
+        # modified files are
+        with open(f"{self.src}/qt5/page.qml", "w") as f:
+            f.write("Item { id: root }")
+        GUIInterface("test.skill", config={}, cache_now=True,
+                     ui_directories={"qt5": f"{self.src}/qt5"})
+        with open(cached) as f:
+            self.assertEqual(f.read(), "Item { id: root }")
+
+    @patch("ovos_bus_client.apis.gui.get_xdg_cache_save_path")
+    def test_cache_on_set_bus(self, cache_path):
+        cache_path.return_value = self.cache
+        cached = f"{self.cache}/lazy.skill/qt5/page.qml"
+        gui = GUIInterface("lazy.skill", config={},
+                           ui_directories={"qt5": f"{self.src}/qt5"})
+        self.assertFalse(os.path.exists(cached))
+        gui.set_bus(Mock())
+        self.assertTrue(os.path.isfile(cached))
+
+
+class TestGUIInterface(unittest.TestCase):
+    def test_build_message_type(self):
+        gui = GUIInterface("test.skill", config={})
+        self.assertEqual(gui.build_message_type("set"), "test.skill.set")
+        self.assertEqual(gui.build_message_type("test.skill.set"),
+                         "test.skill.set")
+        gui.skill_id = "other.skill"
+        self.assertEqual(gui.build_message_type("set"), "other.skill.set")
+
+    def test_batch_update(self):
+        bus = Mock()
+        gui = GUIInterface("test.skill", bus=bus, config={})
+        gui.show_page("page")
+        bus.emit.reset_mock()
+
+        with gui.batch_update():
+            gui["a"] = 1
+            gui["b"] = 2
+            gui["c"] = 3
+        self.assertEqual(bus.emit.call_count, 1)
+        message = bus.emit.call_args[0][0]
+        self.assertEqual(message.msg_type, "gui.value.set")
+        self.assertEqual(message.data["c"], 3)
+
+        # nothing changed -> nothing sent
+        bus.emit.reset_mock()
+        with gui.batch_update():
+            gui["a"] = 1
+        bus.emit.assert_not_called()
+
+    @patch("ovos_bus_client.apis.gui.get_xdg_cache_save_path")
+    def test_resolve_url(self, cache_path):
+        cache = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache, ignore_errors=True)
+        cache_path.return_value = cache
+        gui = GUIInterface("resolve.skill", config={},
+                           ui_directories={"qt5": "/not/used"})
+        os.makedirs(f"{cache}/resolve.skill/qt5")
+        with open(f"{cache}/resolve.skill/qt5/img.png", "w") as f:
+            f.write("png")
+        self.assertEqual(gui._resolve_url("img.png"),
+                         f"{cache}/resolve.skill/qt5/img.png")
+        self.assertEqual(gui._resolve_url("missing.png"), "missing.png")
+        self.assertEqual(gui._resolve_url("http://host/img.png"),
+                         "http://host/img.png")
+
+        # a different cache root (e.g. XDG_CACHE_HOME) is not served stale
+        with tempfile.TemporaryDirectory() as other:
+            cache_path.return_value = other
+            os.makedirs(f"{other}/resolve.skill/qt5")
+            with open(f"{other}/resolve.skill/qt5/img.png", "w") as f:
+                f.write("png")
+            self.assertEqual(gui._resolve_url("img.png"),
+                             f"{other}/resolve.skill/qt5/img.png")
+
+    def test_nested_dict_sync(self):
+        bus = Mock()
+        gui = GUIInterface("test.skill", bus=bus, config={})
+        gui["nested"] = {"a": 1}
+        gui["nested"]["a"] = 2
+        bus.emit.assert_not_called()  # no page shown yet
+
+        gui.show_page("page")
+        bus.emit.reset_mock()
+        gui["nested"]["a"] = 3
+        self.assertEqual(bus.emit.call_count, 1)
+        self.assertEqual(bus.emit.call_args[0][0].data["nested"], {"a": 3})
+
+    def test_setitem_none(self):
+        gui = GUIInterface("test.skill", config={})
+        self.assertNotIn("title", gui)
+        gui["title"] = None
+        self.assertIn("title", gui)
+        self.assertIsNone(gui["title"])
+
+    def test_register_handlers(self):
+        bus = Mock()
+        gui = GUIInterface("test.skill", bus=bus, config={})
+        bus.on.assert_any_call("test.skill.set", gui.gui_set)
+
+        handler = Mock()
+        gui.register_handlers([("a", handler), ("test.skill.b", handler)])
+        bus.on.assert_any_call("test.skill.a", handler)
+        bus.on.assert_any_call("test.skill.b", handler)
+
+        gui.unregister_handler("b", handler)
+        bus.remove.assert_called_once_with("test.skill.b", handler)
+        self.assertNotIn("test.skill.b", gui._events)
+
+        bus.remove.reset_mock()
+        gui.shutdown()
+        bus.remove.assert_any_call("test.skill.set", gui.gui_set)
+        bus.remove.assert_any_call("test.skill.a", handler)
+        self.assertEqual(bus.remove.call_count, 3)
+        self.assertEqual(gui._events, {})
+
+        with self.assertRaises(RuntimeError):
+            GUIInterface("test.skill", config={}).register_handlers(
+                [("a", handler)])
+
+    def test_normalize_page_name(self):
+        self.assertEqual(GUIInterface._normalize_page_name("page.qml"), "page")
+        self.assertEqual(GUIInterface._normalize_page_name("page"), "page")
+        with self.assertRaises(ValueError):
+            GUIInterface._normalize_page_name(__file__)
+
+    def test_gui_set(self):
+        from ovos_bus_client.message import Message
+        bus = Mock()
+        gui = GUIInterface("test.skill", bus=bus, config={})
+        callback = Mock()
+        gui.set_on_gui_changed(callback)
+        gui.show_page("page")
+        bus.emit.reset_mock()
+
+        gui.gui_set(Message("test.skill.set", {"a": 1, "b": 2, "c": 3}))
+        self.assertEqual(gui["b"], 2)
+        self.assertEqual(bus.emit.call_count, 1)
+        callback.assert_called_once()
+
+    def test_sync_delta(self):
+        bus = Mock()
+        gui = GUIInterface("test.skill", bus=bus, config={})
+        gui["a"] = 1
+        gui["nested"] = {"x": 1}
+        gui.show_page("page")
+        # full snapshot on page show
+        self.assertEqual(bus.emit.call_args_list[-2][0][0].data,
+                         {"a": 1, "nested": {"x": 1}, "__from": "test.skill"})
+
+        gui["b"] = 2
+        self.assertEqual(bus.emit.call_args[0][0].data,
+                         {"b": 2, "__from": "test.skill"})
+        gui["nested"]["x"] = 2
+        self.assertEqual(bus.emit.call_args[0][0].data,
+                         {"nested": {"x": 2}, "__from": "test.skill"})
+
+    @patch("ovos_bus_client.apis.gui.can_use_gui")
+    def test_connected_cache(self, can_use_gui):
+        can_use_gui.return_value = True
+        gui = GUIInterface("test.skill", config={})
+        self.assertFalse(gui.connected)  # no bus
+        gui.set_bus(Mock())
+        self.assertTrue(gui.connected)
+        self.assertTrue(gui.connected)
+        can_use_gui.assert_called_once()
+        gui._connected_ts = 0.0  # expire
+        can_use_gui.return_value = False
+        self.assertFalse(gui.connected)
+
+    def test_show_remove_pages(self):
+        bus = Mock()
+        gui = GUIInterface("test.skill", bus=bus, config={})
+        gui.show_pages(["a.qml", "b"])
+        # no session data -> only the page is sent
+        self.assertEqual(bus.emit.call_count, 1)
+        message = bus.emit.call_args[0][0]
+        self.assertEqual(message.msg_type, "gui.page.show")
+        self.assertEqual(message.data["page_names"], ["a", "b"])
+        self.assertEqual(gui.page, "a")
+        gui.current_page_idx = 1
+        self.assertEqual(gui.page, "b")
+
+        gui.remove_page("a.qml")
+        message = bus.emit.call_args[0][0]
+        self.assertEqual(message.msg_type, "gui.page.delete")
+        self.assertEqual(message.data["page_names"], ["a"])
+
+        with self.assertRaises(ValueError):
+            gui.show_pages(("a", "b"))
+        # absolute paths are rejected with or without the .qml extension
+        with self.assertRaises(ValueError):
+            gui.show_pages(["a", "/abs/path/page"])
+        with self.assertRaises(ValueError):
+            gui.remove_pages(["/abs/path/page.qml"])
+
+        gui.clear()
+        self.assertIsNone(gui.page)
+
+    def test_nested_dict_batch(self):
+        bus = Mock()
+        gui = GUIInterface("test.skill", bus=bus, config={})
+        gui["nested"] = {"x": 1, "y": 1}
+        gui["other"] = gui["nested"]
+        gui.show_page("page")
+        bus.emit.reset_mock()
+        with gui.batch_update():
+            gui["nested"]["x"] = 2
+            gui["nested"]["y"] = 2
+        self.assertEqual(bus.emit.call_count, 1)
+        self.assertEqual(bus.emit.call_args[0][0].data,
+                         {"nested": {"x": 2, "y": 2}, "__from": "test.skill"})
+        # re-assigned dicts are wrapped per key
+        self.assertEqual(gui["other"], {"x": 1, "y": 1})
+
+    @patch("ovos_bus_client.apis.gui.Configuration")
+    def test_gui_disabled(self, config):
+        config.return_value = {"gui": {"disable_gui": True}}
+        bus = Mock()
+        gui = GUIInterface("test.skill", bus=bus, config={})
+        self.assertTrue(gui.gui_disabled)
+        gui.show_page("page")
+        gui["a"] = 1
+        bus.emit.assert_not_called()
+
+        bus.on.assert_any_call("configuration.updated",
+                               gui._on_config_updated)
+        config.return_value = {"gui": {"disable_gui": False}}
+        gui._on_config_updated()
+        self.assertFalse(gui.gui_disabled)
+
+    def test_no_bus(self):
+        gui = GUIInterface("test.skill", config={})
+        with patch("ovos_bus_client.apis.gui.LOG") as log:
+            gui.show_page("page")
+            gui["a"] = 1
+            gui.send_event("event")
+            gui.release()
+            log.warning.assert_called_once()
+
+    def test_async_emit(self):
+        from threading import Event
+        bus = Mock()
+        done = Event()
+        bus.emit.side_effect = lambda m: m.msg_type == "gui.page.show" \
+            and done.set()
+        gui = GUIInterface("test.skill", bus=bus, config={}, async_emit=True)
+        gui["a"] = 1
+        gui.show_page("page")
+        self.assertTrue(done.wait(2))
+        self.assertEqual([c[0][0].msg_type for c in bus.emit.call_args_list],
+                         ["gui.value.set", "gui.page.show"])
+
+    def test_emit_worker_no_deadlock(self):
+        from threading import Event
+        from ovos_bus_client.apis.gui import _EmitWorker
+        from ovos_bus_client.message import Message
+        worker = _EmitWorker(maxsize=1)
+        bus = Mock()
+        done = Event()
+
+        def emit(message):
+            if message.msg_type == "first":
+                # emitting from the worker thread while the queue is full
+                worker.submit(bus, Message("nested"))
+                worker.submit(bus, Message("nested"))
+                done.set()
+
+        bus.emit.side_effect = emit
+        worker.submit(bus, Message("first"))
+        self.assertTrue(done.wait(2))
+
+        # a full queue falls back to emitting in the caller
+        started, blocked = Event(), Event()
+
+        def block(message):
+            if message.msg_type == "block":
+                started.set()
+                blocked.wait(2)
+
+        bus.emit.side_effect = block
+        worker.submit(bus, Message("block"))
+        self.assertTrue(started.wait(2))
+        worker.submit(bus, Message("queued"))
+        worker.submit(bus, Message("direct"))
+        self.assertIn("direct",
+                      [c[0][0].msg_type for c in bus.emit.call_args_list])
+        blocked.set()
+
+    def test_concurrent_writes(self):
+        from threading import Thread
+        bus = Mock()
+        gui = GUIInterface("test.skill", bus=bus, config={})
+        gui.show_page("page")
+
+        def write(n):
+            for i in range(200):
+                gui[f"{n}_{i}"] = i
+
+        threads = [Thread(target=write, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        sent = {}
+        for c in bus.emit.call_args_list:
+            if c[0][0].msg_type == "gui.value.set":
+                sent.update(c[0][0].data)
+        sent.pop("__from")
+        self.assertEqual(len(sent), 800)
+        self.assertEqual(gui._dirty_keys, set())
+
+    def test_deep_nested_sync(self):
+        bus = Mock()
+        gui = GUIInterface("test.skill", bus=bus, config={})
+        gui["profile"] = {"name": {"first": "a"}}
+        gui["other"] = 1
+        gui.show_page("page")
+        bus.emit.reset_mock()
+        gui["profile"]["name"]["first"] = "b"
+        self.assertEqual(bus.emit.call_count, 1)
+        self.assertEqual(bus.emit.call_args[0][0].data,
+                         {"profile": {"name": {"first": "b"}},
+                          "__from": "test.skill"})
+        gui["profile"]["address"] = {"city": "x"}
+        gui["profile"]["address"]["city"] = "y"
+        self.assertEqual(bus.emit.call_args[0][0].data["profile"]["address"],
+                         {"city": "y"})
+
+    def test_show_helpers(self):
+        bus = Mock()
+        gui = GUIInterface("test.skill", bus=bus, config={})
+        gui.show_text("hello", "title")
+        gui.show_input_box("title")
+        bus.emit.reset_mock()
+
+        # page already shown, data and page still go out in 2 messages
+        gui.show_text("world")
+        self.assertEqual([c[0][0].msg_type for c in bus.emit.call_args_list],
+                         ["gui.value.set", "gui.page.show"])
+        data = bus.emit.call_args_list[0][0][0].data
+        self.assertEqual(data["text"], "world")
+        self.assertIsNone(data["title"])
+        self.assertEqual(data["confirm_text"], "Confirm")
+
+    def test_session_size(self):
+        gui = GUIInterface("test.skill",
+                           config={"max_session_value_bytes": 1024})
+        self.assertEqual(gui.session_data_bytes, 0)
+        with patch("ovos_bus_client.apis.gui.LOG") as log:
+            gui["small"] = "x"
+            log.warning.assert_not_called()
+            gui["big"] = "x" * 2048
+            gui["big"] = "y" * 2048
+            log.warning.assert_called_once()
+        self.assertGreater(gui.session_data_bytes, 2048)
+        self.assertLess(gui.session_data_bytes, 2048 + 1024)
+        gui["big"] = "z"
+        self.assertLess(gui.session_data_bytes, 1024)
+        gui.clear()
+        self.assertEqual(gui.session_data_bytes, 0)
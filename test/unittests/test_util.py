@@ -57,3 +57,21 @@ class TestEventScheduler(unittest.TestCase):
         self.assertNotEqual(scheduler, self.scheduler)
         scheduler.shutdown()
 
+
+class TestBinaryMessages(unittest.TestCase):
+    def test_binary_roundtrip(self):
+        from unittest.mock import Mock
+        from ovos_bus_client.util import (send_binary_data_message,
+                                          decode_binary_message)
+        payload = b"\x00\x01binary\xff"
+        for encoding in ("hex", "base64"):
+            bus = Mock()
+            send_binary_data_message(payload, bus=bus, encoding=encoding)
+            message = bus.emit.call_args[0][0]
+            self.assertEqual(message.data["encoding"], encoding)
+            self.assertEqual(decode_binary_message(message), payload)
+            self.assertEqual(decode_binary_message(message.serialize()),
+                             payload)
+        # legacy payloads without an encoding field are hex
+        self.assertEqual(decode_binary_message({"binary": payload.hex()}),
+                         payload)